@@ -0,0 +1,38 @@
+"""Add keyset pagination indexes
+
+Revision ID: 0b7e4d2c9a15
+Revises: f6c2a8d1b349
+Create Date: 2026-10-17 22:47:30.905114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '0b7e4d2c9a15'
+down_revision = 'f6c2a8d1b349'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # One index per list endpoint, on its filter and sort keys
+    op.create_index('ix_user_created_at_id', 'user', ['created_at', 'id'], unique=False)
+    op.create_index('ix_project_user_id_created_at_id', 'project', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_goal_user_id_created_at_id', 'goal', ['user_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_goal_user_id_created_at', table_name='goal')
+    op.create_index('ix_task_user_id_date_created_at_id', 'task', ['user_id', 'date', 'created_at', 'id'], unique=False)
+    op.create_index('ix_chore_user_id_created_at_id', 'chore', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_chorelog_user_id_date_created_at_id', 'chorelog', ['user_id', 'date', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_chorelog_user_id_date_created_at_id', table_name='chorelog')
+    op.drop_index('ix_chore_user_id_created_at_id', table_name='chore')
+    op.drop_index('ix_task_user_id_date_created_at_id', table_name='task')
+    op.create_index('ix_goal_user_id_created_at', 'goal', ['user_id', 'created_at'], unique=False)
+    op.drop_index('ix_goal_user_id_created_at_id', table_name='goal')
+    op.drop_index('ix_project_user_id_created_at_id', table_name='project')
+    op.drop_index('ix_user_created_at_id', table_name='user')
@@ -0,0 +1,58 @@
+"""Add user_day_stats rollup table
+
+Revision ID: 3b96cad5f824
+Revises: ed9fbb32dd97
+Create Date: 2026-10-17 09:12:44.118203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '3b96cad5f824'
+down_revision = 'ed9fbb32dd97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_day_stats',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('tasks_total', sa.Integer(), nullable=False),
+    sa.Column('tasks_done', sa.Integer(), nullable=False),
+    sa.Column('task_minutes', sa.Integer(), nullable=False),
+    sa.Column('chore_count', sa.Integer(), nullable=False),
+    sa.Column('chore_minutes', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'day')
+    )
+
+    # Backfill from existing tasks and chore logs
+    op.execute("""
+        INSERT INTO user_day_stats
+            (user_id, day, tasks_total, tasks_done, task_minutes, chore_count, chore_minutes)
+        SELECT user_id, day, sum(tasks_total), sum(tasks_done), sum(task_minutes),
+               sum(chore_count), sum(chore_minutes)
+        FROM (
+            SELECT project.user_id, task.date::date AS day, 1 AS tasks_total,
+                   CASE WHEN task.status = 'DONE' THEN 1 ELSE 0 END AS tasks_done,
+                   task.actual_time_minutes AS task_minutes,
+                   0 AS chore_count, 0 AS chore_minutes
+            FROM task
+            JOIN goal ON goal.id = task.goal_id
+            JOIN project ON project.id = goal.project_id
+            UNION ALL
+            SELECT chore.user_id, chorelog.date::date, 0, 0, 0, 1,
+                   chorelog.actual_time_minutes
+            FROM chorelog
+            JOIN chore ON chore.id = chorelog.chore_id
+        ) AS activity
+        GROUP BY user_id, day
+    """)
+
+
+def downgrade():
+    op.drop_table('user_day_stats')
@@ -0,0 +1,25 @@
+"""Add (goal_id, date) index on task
+
+Revision ID: 5f0d8e3c1a72
+Revises: 9c41e7a2d5b0
+Create Date: 2026-10-17 14:05:27.904311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '5f0d8e3c1a72'
+down_revision = '9c41e7a2d5b0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_task_goal_id_date', 'task', ['goal_id', 'date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_task_goal_id_date', table_name='task')
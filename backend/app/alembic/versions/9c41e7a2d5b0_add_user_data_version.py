@@ -0,0 +1,25 @@
+"""Add data_version to user
+
+Revision ID: 9c41e7a2d5b0
+Revises: 3b96cad5f824
+Create Date: 2026-10-17 11:40:03.562917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '9c41e7a2d5b0'
+down_revision = '3b96cad5f824'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('user', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    op.drop_column('user', 'data_version')
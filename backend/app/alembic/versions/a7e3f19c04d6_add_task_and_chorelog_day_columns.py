@@ -0,0 +1,34 @@
+"""Add generated day columns to task and chorelog
+
+Revision ID: a7e3f19c04d6
+Revises: 5f0d8e3c1a72
+Create Date: 2026-10-17 16:21:50.337412
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e3f19c04d6'
+down_revision = '5f0d8e3c1a72'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('task', sa.Column('day', sa.Date(), sa.Computed('CAST(date AS DATE)', persisted=True), nullable=True))
+    op.add_column('chorelog', sa.Column('day', sa.Date(), sa.Computed('CAST(date AS DATE)', persisted=True), nullable=True))
+    op.create_index('ix_task_goal_id_day', 'task', ['goal_id', 'day'], unique=False)
+    op.create_index('ix_chorelog_chore_id_day', 'chorelog', ['chore_id', 'day'], unique=False)
+    # Day filters replace the timestamp range filters this index served
+    op.drop_index('ix_task_goal_id_date', table_name='task')
+
+
+def downgrade():
+    op.create_index('ix_task_goal_id_date', 'task', ['goal_id', 'date'], unique=False)
+    op.drop_index('ix_chorelog_chore_id_day', table_name='chorelog')
+    op.drop_index('ix_task_goal_id_day', table_name='task')
+    op.drop_column('chorelog', 'day')
+    op.drop_column('task', 'day')
@@ -0,0 +1,56 @@
+"""Make chorelog (chore_id, day) unique
+
+Revision ID: c4d2b8e61f93
+Revises: a7e3f19c04d6
+Create Date: 2026-10-17 18:03:27.905114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d2b8e61f93'
+down_revision = 'a7e3f19c04d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep one log per chore and day (the one with the most time logged,
+    # then the oldest) and take the removed duplicates out of the rollup
+    op.execute("""
+        WITH ranked AS (
+            SELECT id, row_number() OVER (
+                PARTITION BY chore_id, day
+                ORDER BY actual_time_minutes DESC, created_at, id
+            ) AS position
+            FROM chorelog
+        ),
+        removed AS (
+            DELETE FROM chorelog
+            USING ranked
+            WHERE chorelog.id = ranked.id AND ranked.position > 1
+            RETURNING chorelog.chore_id, chorelog.day, chorelog.actual_time_minutes
+        )
+        UPDATE user_day_stats
+        SET chore_count = user_day_stats.chore_count - duplicates.chore_count,
+            chore_minutes = user_day_stats.chore_minutes - duplicates.chore_minutes
+        FROM (
+            SELECT chore.user_id, removed.day, count(*) AS chore_count,
+                   sum(removed.actual_time_minutes) AS chore_minutes
+            FROM removed
+            JOIN chore ON chore.id = removed.chore_id
+            GROUP BY chore.user_id, removed.day
+        ) AS duplicates
+        WHERE user_day_stats.user_id = duplicates.user_id
+          AND user_day_stats.day = duplicates.day
+    """)
+    op.drop_index('ix_chorelog_chore_id_day', table_name='chorelog')
+    op.create_index('uq_chorelog_chore_id_day', 'chorelog', ['chore_id', 'day'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_chorelog_chore_id_day', table_name='chorelog')
+    op.create_index('ix_chorelog_chore_id_day', 'chorelog', ['chore_id', 'day'], unique=False)
@@ -0,0 +1,50 @@
+"""Add chore recurrence rules and next_due_at
+
+Revision ID: d81f5a3c92e7
+Revises: c4d2b8e61f93
+Create Date: 2026-10-17 19:26:08.514770
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81f5a3c92e7'
+down_revision = 'c4d2b8e61f93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The defaults match the previous fixed rules: every day, Mondays and the 1st
+    op.add_column('chore', sa.Column('interval_days', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('chore', sa.Column('weekdays', postgresql.ARRAY(sa.Integer()), server_default='{0}', nullable=False))
+    op.add_column('chore', sa.Column('month_day', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('chore', sa.Column('next_due_at', sa.DateTime(), nullable=True))
+
+    # First day from today on that each chore is due
+    op.execute("""
+        UPDATE chore
+        SET next_due_at = (
+            SELECT min(due.day)
+            FROM generate_series(
+                current_date::timestamp, current_date::timestamp + interval '30 days',
+                interval '1 day'
+            ) AS due(day)
+            WHERE chore.frequency = 'DAILY'
+               OR (chore.frequency = 'WEEKLY' AND extract(isodow FROM due.day) = 1)
+               OR (chore.frequency = 'MONTHLY' AND extract(day FROM due.day) = 1)
+        )
+    """)
+    op.create_index('ix_chore_user_id_next_due_at', 'chore', ['user_id', 'next_due_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_chore_user_id_next_due_at', table_name='chore')
+    op.drop_column('chore', 'next_due_at')
+    op.drop_column('chore', 'month_day')
+    op.drop_column('chore', 'weekdays')
+    op.drop_column('chore', 'interval_days')
@@ -0,0 +1,25 @@
+"""Add partial index on pending chore logs
+
+Revision ID: e5b7c0d4a218
+Revises: d81f5a3c92e7
+Create Date: 2026-10-17 20:41:55.362907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b7c0d4a218'
+down_revision = 'd81f5a3c92e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_chorelog_pending_chore_id_day', 'chorelog', ['chore_id', 'day'], unique=False, postgresql_where=sa.text('actual_time_minutes = 0'))
+
+
+def downgrade():
+    op.drop_index('ix_chorelog_pending_chore_id_day', table_name='chorelog', postgresql_where=sa.text('actual_time_minutes = 0'))
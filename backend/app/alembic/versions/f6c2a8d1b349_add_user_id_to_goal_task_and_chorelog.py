@@ -0,0 +1,56 @@
+"""Add user_id to goal, task and chorelog
+
+Revision ID: f6c2a8d1b349
+Revises: e5b7c0d4a218
+Create Date: 2026-10-17 22:03:12.418326
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6c2a8d1b349'
+down_revision = 'e5b7c0d4a218'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('goal', sa.Column('user_id', sa.Uuid(), nullable=True))
+    op.add_column('task', sa.Column('user_id', sa.Uuid(), nullable=True))
+    op.add_column('chorelog', sa.Column('user_id', sa.Uuid(), nullable=True))
+
+    # Copy the owner down from the parent rows
+    op.execute("""
+        UPDATE goal SET user_id = project.user_id
+        FROM project
+        WHERE project.id = goal.project_id
+    """)
+    op.execute("""
+        UPDATE task SET user_id = goal.user_id
+        FROM goal
+        WHERE goal.id = task.goal_id
+    """)
+    op.execute("""
+        UPDATE chorelog SET user_id = chore.user_id
+        FROM chore
+        WHERE chore.id = chorelog.chore_id
+    """)
+
+    for table in ('goal', 'task', 'chorelog'):
+        op.alter_column(table, 'user_id', nullable=False)
+        op.create_foreign_key(None, table, 'user', ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_index('ix_goal_user_id_created_at', 'goal', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_task_user_id_day', 'task', ['user_id', 'day'], unique=False)
+    op.create_index('ix_chorelog_user_id_day', 'chorelog', ['user_id', 'day'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_chorelog_user_id_day', table_name='chorelog')
+    op.drop_index('ix_task_user_id_day', table_name='task')
+    op.drop_index('ix_goal_user_id_created_at', table_name='goal')
+    op.drop_column('chorelog', 'user_id')
+    op.drop_column('task', 'user_id')
+    op.drop_column('goal', 'user_id')
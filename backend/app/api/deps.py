@@ -1,17 +1,20 @@
+import uuid
 from collections.abc import Generator
+from datetime import datetime
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
-from sqlmodel import Session
+from sqlalchemy.orm import contains_eager
+from sqlmodel import Session, select
 
 from app.core import security
 from app.core.config import settings
 from app.core.db import engine
-from app.models import TokenPayload, User
+from app.models import ChoreLog, Goal, Task, TokenPayload, User
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
@@ -55,3 +58,80 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
             status_code=403, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+
+def check_data_etag(
+    request: Request, response: Response, current_user: CurrentUser
+) -> str:
+    """
+    Tag per-user DailyOS reads with the user's data version.
+
+    Responds 304 before the route runs any entity query when the client
+    already holds the current version. The UTC day is part of the tag so
+    views with relative periods ("this week") roll over.
+    """
+    today = datetime.utcnow().date()
+    etag = f'W/"{current_user.id.hex}-{current_user.data_version}-{today:%Y%m%d}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return etag
+
+
+def _check_owner(owner_id: uuid.UUID, current_user: User) -> None:
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+
+def get_owned_goal(
+    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+) -> Goal:
+    """
+    Load a goal together with its project, whose allocations bound the
+    goal's, in one query and check the current user owns it.
+    """
+    goal = session.exec(
+        select(Goal)
+        .join(Goal.project)
+        .options(contains_eager(Goal.project))
+        .where(Goal.id == id)
+    ).first()
+    if not goal:
+        raise HTTPException(status_code=404, detail="Goal not found")
+    _check_owner(goal.user_id, current_user)
+    return goal
+
+
+def get_owned_task(
+    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+) -> Task:
+    """
+    Load a task and check the current user owns it.
+    """
+    task = session.get(Task, id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    _check_owner(task.user_id, current_user)
+    return task
+
+
+def get_owned_chore_log(
+    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+) -> ChoreLog:
+    """
+    Load a chore log and check the current user owns it.
+    """
+    chore_log = session.get(ChoreLog, id)
+    if not chore_log:
+        raise HTTPException(status_code=404, detail="Chore log not found")
+    _check_owner(chore_log.user_id, current_user)
+    return chore_log
+
+
+OwnedGoal = Annotated[Goal, Depends(get_owned_goal)]
+OwnedTask = Annotated[Task, Depends(get_owned_task)]
+OwnedChoreLog = Annotated[ChoreLog, Depends(get_owned_chore_log)]
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.routes import chore_logs, chores, dashboard, goals, login, projects, tasks, users, utils
+from app.api.routes import chore_logs, chores, dashboard, goals, login, projects, tasks, time_tracking, users, utils
 from app.core.config import settings
 
 api_router = APIRouter()
@@ -13,4 +13,5 @@ api_router.include_router(tasks.router)
 api_router.include_router(chores.router)
 api_router.include_router(chore_logs.router)
 api_router.include_router(dashboard.router)
+api_router.include_router(time_tracking.router)
 
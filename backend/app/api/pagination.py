@@ -0,0 +1,119 @@
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import TypeDecorator, literal, tuple_
+from sqlmodel import Session, func, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.models import CountMode
+
+T = TypeVar("T")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Opaque token for the position right after a row with these sort keys.
+    """
+    payload = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else str(value)
+            for value in values
+        ]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _python_type(key: Any) -> type:
+    sql_type = key.type
+    if isinstance(sql_type, TypeDecorator):
+        sql_type = sql_type.impl_instance
+    return sql_type.python_type
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> list[Any]:
+    """
+    Sort key values of a cursor made by encode_cursor for the same keys.
+    Raises 400 for a malformed cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        parsed = []
+        for value, key in zip(values, keys, strict=True):
+            python_type = _python_type(key)
+            if python_type is datetime:
+                parsed.append(datetime.fromisoformat(value))
+            elif python_type is uuid.UUID:
+                parsed.append(uuid.UUID(value))
+            else:
+                parsed.append(python_type(value))
+        return parsed
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def paginate(
+    session: Session,
+    statement: SelectOfScalar[T],
+    keys: Sequence[Any],
+    *,
+    cursor: str | None,
+    skip: int,
+    limit: int,
+) -> tuple[list[T], str | None]:
+    """
+    Fetch a page of statement's rows ordered by keys, the last of which must
+    be unique (e.g. the id).
+
+    With a cursor the page starts right after the row the cursor was taken
+    from, by seeking on the keys' composite index; otherwise the first skip
+    rows are skipped. Returns the rows and the next page's cursor, None on
+    the last page.
+    """
+    if cursor is not None:
+        values = decode_cursor(cursor, keys)
+        bounds = [
+            literal(value, key.type)
+            for value, key in zip(values, keys, strict=True)
+        ]
+        statement = statement.where(tuple_(*keys) > tuple_(*bounds))
+    elif skip:
+        statement = statement.offset(skip)
+
+    # One extra row tells whether there is a next page
+    rows = list(session.exec(statement.order_by(*keys).limit(limit + 1)).all())
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], key.key) for key in keys])
+
+
+def count_rows(
+    session: Session, statement: SelectOfScalar[Any], include_count: CountMode
+) -> int | None:
+    """
+    Total number of rows of a list statement: None, an exact count(*) or the
+    planner's row estimate, which only costs planning the query.
+    """
+    if include_count == CountMode.NONE:
+        return None
+    if include_count == CountMode.EXACT:
+        count_statement = select(func.count()).select_from(statement.subquery())
+        return session.exec(count_statement).one()
+
+    connection = session.connection()
+    compiled = statement.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
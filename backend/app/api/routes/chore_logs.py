@@ -1,11 +1,13 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import select
 
-from app.api.deps import CurrentUser, SessionDep
+from app import crud
+from app.api.deps import CurrentUser, OwnedChoreLog, SessionDep, check_data_etag
+from app.api.pagination import count_rows, paginate
 from app.models import (
     Chore,
     ChoreLog,
@@ -13,31 +15,54 @@ from app.models import (
     ChoreLogPublic,
     ChoreLogsPublic,
     ChoreLogUpdate,
+    CountMode,
     Message,
 )
 
 router = APIRouter(prefix="/chore-logs", tags=["chore-logs"])
 
 
-@router.get("/", response_model=ChoreLogsPublic)
+def _check_day_is_free(
+    session: SessionDep, chore_id: uuid.UUID, day: date, log_id: uuid.UUID | None = None
+) -> None:
+    """
+    Raise 409 if the chore already has another log on that day.
+    """
+    statement = select(ChoreLog.id).where(
+        ChoreLog.chore_id == chore_id, ChoreLog.day == day
+    )
+    if log_id is not None:
+        statement = statement.where(ChoreLog.id != log_id)
+    if session.exec(statement).first():
+        raise HTTPException(
+            status_code=409, detail="This chore already has a log for that day"
+        )
+
+
+@router.get(
+    "/",
+    response_model=ChoreLogsPublic,
+    dependencies=[Depends(check_data_etag)],
+)
 def read_chore_logs(
     session: SessionDep, 
     current_user: CurrentUser, 
     chore_id: uuid.UUID | None = None,
     date_from: datetime | None = None,
     date_to: datetime | None = None,
+    cursor: str | None = None,
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    include_count: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     Retrieve chore logs for the current user, optionally filtered by chore and date range.
+    Pass the previous page's next_cursor to get the next page; skip is only
+    used without a cursor. include_count=estimate returns the planner's row
+    estimate and include_count=none skips counting.
     """
-    # Base query for user's chore logs through chore relationship
-    base_query = (
-        select(ChoreLog)
-        .join(Chore)
-        .where(Chore.user_id == current_user.id)
-    )
+    # Base query for user's chore logs
+    base_query = select(ChoreLog).where(ChoreLog.user_id == current_user.id)
     
     # Filter by chore if specified
     if chore_id:
@@ -50,35 +75,26 @@ def read_chore_logs(
         base_query = base_query.where(ChoreLog.date <= date_to)
     
     # Count query
-    count_statement = select(func.count()).select_from(base_query.subquery())
-    count = session.exec(count_statement).one()
+    count = count_rows(session, base_query, include_count)
     
     # Data query with pagination
-    statement = (
-        base_query
-        .offset(skip)
-        .limit(limit)
-        .order_by(ChoreLog.date, ChoreLog.created_at)
+    chore_logs, next_cursor = paginate(
+        session,
+        base_query,
+        (ChoreLog.date, ChoreLog.created_at, ChoreLog.id),
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
     )
-    chore_logs = session.exec(statement).all()
 
-    return ChoreLogsPublic(data=chore_logs, count=count)
+    return ChoreLogsPublic(data=chore_logs, count=count, next_cursor=next_cursor)
 
 
 @router.get("/{id}", response_model=ChoreLogPublic)
-def read_chore_log(session: SessionDep, current_user: CurrentUser, id: uuid.UUID) -> Any:
+def read_chore_log(chore_log: OwnedChoreLog) -> Any:
     """
     Get chore log by ID.
     """
-    chore_log = session.get(ChoreLog, id)
-    if not chore_log:
-        raise HTTPException(status_code=404, detail="Chore log not found")
-    
-    # Check if user owns the chore that this log belongs to
-    chore = session.get(Chore, chore_log.chore_id)
-    if not chore or chore.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
     return chore_log
 
 
@@ -96,8 +112,17 @@ def create_chore_log(
     if chore.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    chore_log = ChoreLog.model_validate(chore_log_in)
+    chore_log = ChoreLog.model_validate(chore_log_in, update={"user_id": chore.user_id})
+    _check_day_is_free(session, chore.id, chore_log.date.date())
     session.add(chore_log)
+    crud.update_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        changes=[crud.chore_log_day_stats(chore_log)],
+    )
+    crud.advance_chores_past(
+        session=session, chore_ids=[chore.id], day=chore_log.date.date()
+    )
     session.commit()
     session.refresh(chore_log)
     return chore_log
@@ -108,24 +133,37 @@ def update_chore_log(
     *,
     session: SessionDep,
     current_user: CurrentUser,
-    id: uuid.UUID,
+    chore_log: OwnedChoreLog,
     chore_log_in: ChoreLogUpdate,
 ) -> Any:
     """
     Update a chore log.
     """
-    chore_log = session.get(ChoreLog, id)
-    if not chore_log:
-        raise HTTPException(status_code=404, detail="Chore log not found")
-    
-    # Check if user owns the chore that this log belongs to
-    chore = session.get(Chore, chore_log.chore_id)
-    if not chore or chore.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
+    previous_stats = crud.chore_log_day_stats(chore_log, sign=-1)
+    previous_day = chore_log.date.date()
     update_dict = chore_log_in.model_dump(exclude_unset=True)
+    if update_dict.get("date") is not None:
+        _check_day_is_free(
+            session, chore_log.chore_id, update_dict["date"].date(), chore_log.id
+        )
     chore_log.sqlmodel_update(update_dict)
     session.add(chore_log)
+    crud.update_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        changes=[previous_stats, crud.chore_log_day_stats(chore_log)],
+    )
+    day = chore_log.date.date()
+    if day != previous_day:
+        crud.advance_chores_past(
+            session=session, chore_ids=[chore_log.chore_id], day=day
+        )
+        crud.reopen_chore_day(
+            session=session,
+            chore_id=chore_log.chore_id,
+            day=previous_day,
+            log_id=chore_log.id,
+        )
     session.commit()
     session.refresh(chore_log)
     return chore_log
@@ -133,20 +171,22 @@ def update_chore_log(
 
 @router.delete("/{id}")
 def delete_chore_log(
-    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+    session: SessionDep, current_user: CurrentUser, chore_log: OwnedChoreLog
 ) -> Message:
     """
     Delete a chore log.
     """
-    chore_log = session.get(ChoreLog, id)
-    if not chore_log:
-        raise HTTPException(status_code=404, detail="Chore log not found")
-    
-    # Check if user owns the chore that this log belongs to
-    chore = session.get(Chore, chore_log.chore_id)
-    if not chore or chore.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
+    crud.update_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        changes=[crud.chore_log_day_stats(chore_log, sign=-1)],
+    )
+    crud.reopen_chore_day(
+        session=session,
+        chore_id=chore_log.chore_id,
+        day=chore_log.date.date(),
+        log_id=chore_log.id,
+    )
     session.delete(chore_log)
     session.commit()
     return Message(message="Chore log deleted successfully")
\ No newline at end of file
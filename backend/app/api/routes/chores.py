@@ -1,16 +1,24 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Date, DateTime, case, cast, literal, literal_column, true
+from sqlalchemy.orm import contains_eager
+from sqlmodel import col, func, select
 
-from app.api.deps import CurrentUser, SessionDep
+from app.api.deps import CurrentUser, SessionDep, check_data_etag
+from app.api.pagination import count_rows, paginate
+from app.core.cache import cached_per_user
 from app.crud import (
+    chore_is_due,
     generate_chore_instances,
     get_pending_chore_instances,
     complete_chore_instance,
-    generate_chore_instances_for_date_range
+    complete_chore_instances,
+    generate_chore_instances_for_date_range,
+    remove_user_day_stats,
+    reschedule_chores,
 )
 from app.models import (
     Chore,
@@ -18,25 +26,42 @@ from app.models import (
     ChorePublic,
     ChoresPublic,
     ChoreUpdate,
+    ChoreInstanceCompletion,
     ChoreLog,
     ChoreLogPublic,
     ChoreLogsPublic,
+    CountMode,
     Message,
 )
 
 router = APIRouter(prefix="/chores", tags=["chores"])
 
+# Longest range /generate-instances-range accepts in one request
+MAX_INSTANCE_RANGE_DAYS = 366
 
-@router.get("/", response_model=ChoresPublic)
+# Fields that change when a chore is next due
+RECURRENCE_FIELDS = {"frequency", "interval_days", "weekdays", "month_day", "is_active"}
+
+
+@router.get(
+    "/",
+    response_model=ChoresPublic,
+    dependencies=[Depends(check_data_etag)],
+)
 def read_chores(
     session: SessionDep, 
     current_user: CurrentUser, 
     is_active: bool | None = None,
+    cursor: str | None = None,
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    include_count: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     Retrieve chores for the current user, optionally filtered by active status.
+    Pass the previous page's next_cursor to get the next page; skip is only
+    used without a cursor. include_count=estimate returns the planner's row
+    estimate and include_count=none skips counting.
     """
     # Base query for user's chores
     base_query = select(Chore).where(Chore.user_id == current_user.id)
@@ -46,19 +71,150 @@ def read_chores(
         base_query = base_query.where(Chore.is_active == is_active)
     
     # Count query
-    count_statement = select(func.count()).select_from(base_query.subquery())
-    count = session.exec(count_statement).one()
+    count = count_rows(session, base_query, include_count)
     
     # Data query with pagination
-    statement = (
-        base_query
-        .offset(skip)
-        .limit(limit)
-        .order_by(Chore.created_at)
+    chores, next_cursor = paginate(
+        session,
+        base_query,
+        (Chore.created_at, Chore.id),
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
+    )
+
+    return ChoresPublic(data=chores, count=count, next_cursor=next_cursor)
+
+
+@router.get(
+    "/analytics",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("chore-analytics")
+def get_chore_analytics(
+    session: SessionDep,
+    current_user: CurrentUser,
+    days: int = Query(default=30, ge=7, le=365),
+) -> Any:
+    """
+    Get how reliably each active chore gets done over the last `days` days.
+
+    An occurrence is a day the chore was due. Completion rate and streaks
+    count occurrences with time logged; today's occurrence only counts once
+    it's done. The current streak is the number of latest occurrences done
+    in a row.
+    """
+    end = datetime.utcnow().date()
+    start = end - timedelta(days=days - 1)
+
+    series = func.generate_series(
+        cast(literal(start, Date), DateTime),
+        cast(literal(end, Date), DateTime),
+        literal_column("interval '1 day'"),
+    ).table_valued("value").render_derived()
+    day = cast(series.c.value, Date)
+
+    # Every due day of every active chore in the window, with its log if any
+    done = func.coalesce(ChoreLog.actual_time_minutes > 0, False)
+    occurrences = (
+        select(
+            Chore.id.label("chore_id"),
+            done.label("done"),
+            ChoreLog.actual_time_minutes.label("minutes"),
+            # Occurrences missed on or after this one; 0 while on a streak
+            func.sum(case((done, 0), else_=1))
+            .over(partition_by=Chore.id, order_by=day.desc())
+            .label("missed_since"),
+        )
+        .select_from(Chore)
+        .join(series, true())
+        .outerjoin(ChoreLog, (ChoreLog.chore_id == Chore.id) & (ChoreLog.day == day))
+        .where(
+            Chore.user_id == current_user.id,
+            Chore.is_active == True,
+            day >= cast(Chore.created_at, Date),
+            chore_is_due(day),
+            (day < end) | done,
+        )
+        .subquery("occurrences")
+    )
+    chore_stats = (
+        select(
+            occurrences.c.chore_id,
+            func.count().label("due"),
+            func.count().filter(occurrences.c.done).label("completed"),
+            func.avg(occurrences.c.minutes)
+            .filter(occurrences.c.done)
+            .label("average_actual_minutes"),
+            func.count()
+            .filter(occurrences.c.missed_since == 0)
+            .label("current_streak"),
+        )
+        .group_by(occurrences.c.chore_id)
+        .subquery("chore_stats")
     )
-    chores = session.exec(statement).all()
+    rows = session.exec(
+        select(
+            Chore.id,
+            Chore.name,
+            Chore.frequency,
+            Chore.estimated_time_minutes,
+            func.coalesce(chore_stats.c.due, 0).label("due"),
+            func.coalesce(chore_stats.c.completed, 0).label("completed"),
+            chore_stats.c.average_actual_minutes,
+            func.coalesce(chore_stats.c.current_streak, 0).label("current_streak"),
+        )
+        .outerjoin(chore_stats, chore_stats.c.chore_id == Chore.id)
+        .where(Chore.user_id == current_user.id, Chore.is_active == True)
+        .order_by(Chore.created_at)
+    ).all()
+
+    chores = []
+    for row in rows:
+        average = (
+            round(float(row.average_actual_minutes), 1)
+            if row.average_actual_minutes is not None
+            else None
+        )
+        chores.append({
+            "chore_id": row.id,
+            "name": row.name,
+            "frequency": row.frequency,
+            "estimated_time_minutes": row.estimated_time_minutes,
+            "due": row.due,
+            "completed": row.completed,
+            "completion_rate": (
+                round(row.completed / row.due * 100, 1) if row.due else None
+            ),
+            "average_actual_minutes": average,
+            "actual_vs_estimated": (
+                round(average / row.estimated_time_minutes, 2)
+                if average is not None and row.estimated_time_minutes
+                else None
+            ),
+            "current_streak": row.current_streak,
+        })
 
-    return ChoresPublic(data=chores, count=count)
+    return {"days": days, "start": start, "end": end, "chores": chores}
+
+
+@router.get("/pending-instances", response_model=ChoreLogsPublic)
+def get_pending_chore_instances_endpoint(
+    *,
+    session: SessionDep,
+    current_user: CurrentUser,
+    target_date: datetime | None = None,
+) -> Any:
+    """
+    Get pending (uncompleted) chore instances for the target date (defaults to today).
+    """
+    instances = get_pending_chore_instances(
+        session=session,
+        user_id=current_user.id,
+        target_date=target_date
+    )
+    
+    return ChoreLogsPublic(data=instances, count=len(instances))
 
 
 @router.get("/{id}", response_model=ChorePublic)
@@ -83,6 +239,9 @@ def create_chore(
     """
     chore = Chore.model_validate(chore_in, update={"user_id": current_user.id})
     session.add(chore)
+    reschedule_chores(
+        session=session, chore_ids=[chore.id], from_date=datetime.utcnow().date()
+    )
     session.commit()
     session.refresh(chore)
     return chore
@@ -108,6 +267,10 @@ def update_chore(
     update_dict = chore_in.model_dump(exclude_unset=True)
     chore.sqlmodel_update(update_dict)
     session.add(chore)
+    if RECURRENCE_FIELDS & update_dict.keys():
+        reschedule_chores(
+            session=session, chore_ids=[chore.id], from_date=datetime.utcnow().date()
+        )
     session.commit()
     session.refresh(chore)
     return chore
@@ -126,6 +289,13 @@ def delete_chore(
     if chore.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
+    # Cascaded deletes bypass the per-row rollup updates, so take the chore's
+    # logs out of the rollup first
+    remove_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        chore_log_filter=ChoreLog.chore_id == chore.id,
+    )
     session.delete(chore)
     session.commit()
     return Message(message="Chore deleted successfully")
@@ -149,6 +319,11 @@ def toggle_chore_active(
     
     chore.is_active = not chore.is_active
     session.add(chore)
+    if chore.is_active:
+        # Don't catch up on the days it was paused
+        reschedule_chores(
+            session=session, chore_ids=[chore.id], from_date=datetime.utcnow().date()
+        )
     session.commit()
     session.refresh(chore)
     return chore
@@ -173,59 +348,109 @@ def generate_chore_instances_endpoint(
     return ChoreLogsPublic(data=instances, count=len(instances))
 
 
-@router.get("/pending-instances", response_model=ChoreLogsPublic)
-def get_pending_chore_instances_endpoint(
+@router.patch("/instances/{instance_id}/complete", response_model=ChoreLogPublic)
+def complete_chore_instance_endpoint(
     *,
     session: SessionDep,
     current_user: CurrentUser,
+    instance_id: uuid.UUID,
+    actual_time_minutes: int,
     target_date: datetime | None = None,
 ) -> Any:
     """
-    Get pending (uncompleted) chore instances for the target date (defaults to today).
+    Mark a chore instance as completed with the actual time spent.
+    Virtual instances are looked up among the target date's (defaults to
+    today) pending instances.
     """
-    instances = get_pending_chore_instances(
+    if actual_time_minutes <= 0:
+        raise HTTPException(status_code=400, detail="Actual time must be positive")
+    
+    chore_log = session.exec(
+        select(ChoreLog)
+        .join(ChoreLog.chore)
+        .options(contains_eager(ChoreLog.chore))
+        .where(ChoreLog.id == instance_id)
+    ).first()
+    if chore_log:
+        if chore_log.user_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+    else:
+        pending_instances = get_pending_chore_instances(
+            session=session, user_id=current_user.id, target_date=target_date
+        )
+        chore_log = next(
+            (instance for instance in pending_instances if instance.id == instance_id),
+            None,
+        )
+        if not chore_log:
+            raise HTTPException(status_code=404, detail="Chore instance not found")
+    
+    completed = complete_chore_instance(
         session=session,
-        user_id=current_user.id,
-        target_date=target_date
+        chore_log=chore_log,
+        actual_time_minutes=actual_time_minutes
     )
-    
-    return ChoreLogsPublic(data=instances, count=len(instances))
+    if completed is None:
+        raise HTTPException(
+            status_code=409, detail="Chore instance was already completed"
+        )
+    return completed
 
 
-@router.patch("/instances/{instance_id}/complete", response_model=ChoreLogPublic)
-def complete_chore_instance_endpoint(
+@router.post("/instances/complete", response_model=ChoreLogsPublic)
+def complete_chore_instances_endpoint(
     *,
     session: SessionDep,
     current_user: CurrentUser,
-    instance_id: uuid.UUID,
-    actual_time_minutes: int,
+    completions: list[ChoreInstanceCompletion],
+    target_date: datetime | None = None,
 ) -> Any:
     """
-    Mark a chore instance as completed with the actual time spent.
+    Complete several chore instances at once, e.g. a whole routine.
+    Virtual instances are looked up among the target date's (defaults to
+    today) pending instances.
     """
-    if actual_time_minutes <= 0:
-        raise HTTPException(status_code=400, detail="Actual time must be positive")
-    
-    # Verify the chore instance belongs to the current user
-    chore_log = session.get(ChoreLog, instance_id)
-    if not chore_log:
-        raise HTTPException(status_code=404, detail="Chore instance not found")
-    
-    # Check ownership through chore relationship
-    chore = session.get(Chore, chore_log.chore_id)
-    if not chore or chore.user_id != current_user.id:
+    instance_ids = [completion.instance_id for completion in completions]
+    if not instance_ids:
+        raise HTTPException(status_code=400, detail="No chore instances given")
+    if len(set(instance_ids)) != len(instance_ids):
+        raise HTTPException(
+            status_code=400, detail="Each chore instance can only be completed once"
+        )
+
+    # Ownership of every existing instance in one query
+    existing = session.exec(
+        select(ChoreLog).where(col(ChoreLog.id).in_(instance_ids))
+    ).all()
+    if any(chore_log.user_id != current_user.id for chore_log in existing):
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    completed_instance = complete_chore_instance(
+    instances = {chore_log.id: chore_log for chore_log in existing}
+
+    if len(instances) < len(instance_ids):
+        pending_instances = get_pending_chore_instances(
+            session=session, user_id=current_user.id, target_date=target_date
+        )
+        instances.update(
+            (instance.id, instance)
+            for instance in pending_instances
+            if instance.id in instance_ids and instance.id not in instances
+        )
+        if len(instances) < len(instance_ids):
+            raise HTTPException(status_code=404, detail="Chore instance not found")
+
+    completed = complete_chore_instances(
         session=session,
-        chore_log_id=instance_id,
-        actual_time_minutes=actual_time_minutes
+        user_id=current_user.id,
+        completions=[
+            (instances[completion.instance_id], completion.actual_time_minutes)
+            for completion in completions
+        ],
     )
-    
-    if not completed_instance:
-        raise HTTPException(status_code=404, detail="Chore instance not found")
-    
-    return completed_instance
+    if completed is None:
+        raise HTTPException(
+            status_code=409, detail="Chore instance was already completed"
+        )
+    return ChoreLogsPublic(data=completed, count=len(completed))
 
 
 @router.post("/generate-instances-range", response_model=ChoreLogsPublic)
@@ -241,6 +466,11 @@ def generate_chore_instances_for_range(
     """
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Start date must be before end date")
+    if (end_date - start_date).days >= MAX_INSTANCE_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range must be at most {MAX_INSTANCE_RANGE_DAYS} days",
+        )
     
     instances = generate_chore_instances_for_date_range(
         session=session,
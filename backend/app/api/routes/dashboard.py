@@ -1,23 +1,63 @@
-from datetime import datetime, timedelta
-from typing import Any
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from time import perf_counter
+from typing import Annotated, Any
 
-from fastapi import APIRouter
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import Date, cast, literal_column, true
+from sqlmodel import Session, func, select
 
-from app.api.deps import CurrentUser, SessionDep
+from app.api.deps import CurrentUser, SessionDep, check_data_etag
+from app.api.routes.time_tracking import get_daily_time_summary
+from app.core.cache import cached_per_user
+from app.core.config import settings
+from app.core.db import engine
+from app.crud import get_pending_chore_instances
 from app.models import (
     Chore,
-    ChoreLog,
+    ChoreLogPublic,
+    ChoreLogsPublic,
     Goal,
     Project,
     Task,
-    TaskStatus,
+    TimeGranularity,
+    TimeSeriesGroupBy,
+    User,
+    UserDayStats,
 )
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Longest range /time-series accepts in one request
+MAX_TIME_SERIES_DAYS = 3 * 366
 
-@router.get("/summary")
+# Runs the independent /bundle sections concurrently, one pooled connection
+# each. Sized to the pool's persistent connections, so however many bundles
+# are in flight, sections never take more than that and leave the overflow
+# to other requests
+_bundle_executor = ThreadPoolExecutor(
+    max_workers=settings.POSTGRES_POOL_SIZE,
+    thread_name_prefix="dashboard-bundle",
+)
+
+
+def _total(column: Any, *filters: Any) -> Any:
+    """
+    Sum a column, optionally restricted with FILTER, treating no rows as 0.
+    """
+    aggregate = func.sum(column)
+    if filters:
+        aggregate = aggregate.filter(*filters)
+    return func.coalesce(aggregate, 0)
+
+
+@router.get(
+    "/summary",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("dashboard-summary")
 def get_dashboard_summary(
     session: SessionDep, 
     current_user: CurrentUser,
@@ -28,110 +68,86 @@ def get_dashboard_summary(
     today = datetime.utcnow().date()
     week_start = today - timedelta(days=today.weekday())
     week_end = week_start + timedelta(days=6)
-    
-    # Project statistics
-    projects_count = session.exec(
-        select(func.count(Project.id)).where(Project.user_id == current_user.id)
-    ).one()
-    
-    # Goal statistics
-    goals_count = session.exec(
-        select(func.count(Goal.id))
-        .select_from(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-    ).one()
-    
-    # Task statistics
-    total_tasks = session.exec(
-        select(func.count(Task.id))
-        .select_from(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-    ).one()
-    
-    completed_tasks = session.exec(
-        select(func.count(Task.id))
-        .select_from(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-        .where(Task.status == TaskStatus.DONE)
-    ).one()
-    
-    # Tasks this week
-    tasks_this_week = session.exec(
-        select(func.count(Task.id))
-        .select_from(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-        .where(Task.date >= week_start)
-        .where(Task.date <= week_end)
-    ).one()
-    
-    completed_tasks_this_week = session.exec(
-        select(func.count(Task.id))
-        .select_from(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-        .where(Task.status == TaskStatus.DONE)
-        .where(Task.date >= week_start)
-        .where(Task.date <= week_end)
-    ).one()
-    
-    # Time statistics
-    total_time_logged = session.exec(
-        select(func.coalesce(func.sum(Task.actual_time_minutes), 0))
-        .select_from(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-    ).one()
-    
-    time_logged_this_week = session.exec(
-        select(func.coalesce(func.sum(Task.actual_time_minutes), 0))
-        .select_from(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-        .where(Task.date >= week_start)
-        .where(Task.date <= week_end)
-    ).one()
-    
-    # Time allocated this week (sum of all project weekly allocations)
-    weekly_time_allocated = session.exec(
-        select(func.coalesce(func.sum(Project.weekly_time_allocated_minutes), 0))
+
+    # One single-row derived table per source table, built from conditional
+    # aggregates, cross-joined so the whole summary is a single round trip.
+    # Task and chore log figures come from the per-day rollup, so their cost
+    # grows with the number of active days rather than the number of rows
+    project_stats = (
+        select(
+            func.count(Project.id).label("total"),
+            func.coalesce(func.sum(Project.weekly_time_allocated_minutes), 0).label(
+                "weekly_allocated"
+            ),
+        )
         .where(Project.user_id == current_user.id)
-    ).one()
-    
-    # Chore statistics
-    active_chores = session.exec(
-        select(func.count(Chore.id))
+        .subquery("project_stats")
+    )
+
+    goal_stats = (
+        select(func.count(Goal.id).label("total"))
+        .where(Goal.user_id == current_user.id)
+        .subquery("goal_stats")
+    )
+
+    in_week = (UserDayStats.day >= week_start) & (UserDayStats.day <= week_end)
+
+    day_stats = (
+        select(
+            _total(UserDayStats.tasks_total).label("tasks_total"),
+            _total(UserDayStats.tasks_done).label("tasks_done"),
+            _total(UserDayStats.task_minutes).label("task_minutes"),
+            _total(UserDayStats.tasks_total, in_week).label("week_tasks_total"),
+            _total(UserDayStats.tasks_done, in_week).label("week_tasks_done"),
+            _total(UserDayStats.task_minutes, in_week).label("week_task_minutes"),
+            _total(UserDayStats.chore_count, in_week).label("week_chore_count"),
+            _total(UserDayStats.chore_minutes, in_week).label("week_chore_minutes"),
+        )
+        .where(UserDayStats.user_id == current_user.id)
+        .subquery("day_stats")
+    )
+
+    chore_stats = (
+        select(func.count(Chore.id).label("active"))
         .where(Chore.user_id == current_user.id)
         .where(Chore.is_active == True)
+        .subquery("chore_stats")
+    )
+
+    stats = session.exec(
+        select(
+            project_stats.c.total.label("projects_count"),
+            project_stats.c.weekly_allocated.label("weekly_time_allocated"),
+            goal_stats.c.total.label("goals_count"),
+            day_stats.c.tasks_total.label("total_tasks"),
+            day_stats.c.tasks_done.label("completed_tasks"),
+            day_stats.c.week_tasks_total.label("tasks_this_week"),
+            day_stats.c.week_tasks_done.label("completed_tasks_this_week"),
+            day_stats.c.task_minutes.label("total_time_logged"),
+            day_stats.c.week_task_minutes.label("time_logged_this_week"),
+            chore_stats.c.active.label("active_chores"),
+            day_stats.c.week_chore_count.label("chore_logs_this_week"),
+            day_stats.c.week_chore_minutes.label("chore_time_this_week"),
+        )
+        .select_from(project_stats)
+        .join(goal_stats, true())
+        .join(day_stats, true())
+        .join(chore_stats, true())
     ).one()
-    
-    chore_logs_this_week = session.exec(
-        select(func.count(ChoreLog.id))
-        .select_from(ChoreLog)
-        .join(Chore)
-        .where(Chore.user_id == current_user.id)
-        .where(ChoreLog.date >= week_start)
-        .where(ChoreLog.date <= week_end)
-    ).one()
-    
-    chore_time_this_week = session.exec(
-        select(func.coalesce(func.sum(ChoreLog.actual_time_minutes), 0))
-        .select_from(ChoreLog)
-        .join(Chore)
-        .where(Chore.user_id == current_user.id)
-        .where(ChoreLog.date >= week_start)
-        .where(ChoreLog.date <= week_end)
-    ).one()
-    
+
+    projects_count = stats.projects_count
+    goals_count = stats.goals_count
+    total_tasks = stats.total_tasks
+    completed_tasks = stats.completed_tasks
+    tasks_this_week = stats.tasks_this_week
+    completed_tasks_this_week = stats.completed_tasks_this_week
+    total_time_logged = stats.total_time_logged
+    time_logged_this_week = stats.time_logged_this_week
+    weekly_time_allocated = stats.weekly_time_allocated
+    active_chores = stats.active_chores
+    chore_logs_this_week = stats.chore_logs_this_week
+    chore_time_this_week = stats.chore_time_this_week
+
     # Calculate completion rates
     task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
     weekly_task_completion_rate = (completed_tasks_this_week / tasks_this_week * 100) if tasks_this_week > 0 else 0
@@ -176,7 +192,11 @@ def get_dashboard_summary(
     }
 
 
-@router.get("/time-by-project")
+@router.get(
+    "/time-by-project",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("dashboard-time-by-project")
 def get_time_by_project(
     session: SessionDep, 
     current_user: CurrentUser,
@@ -187,7 +207,8 @@ def get_time_by_project(
     """
     start_date = datetime.utcnow().date() - timedelta(days=days)
     
-    # Get time logged per project
+    # Get time logged per project. The date filter belongs in the join so
+    # projects without recent tasks still show up with zero time
     result = session.exec(
         select(
             Project.id,
@@ -197,9 +218,8 @@ def get_time_by_project(
         )
         .select_from(Project)
         .outerjoin(Goal)
-        .outerjoin(Task)
+        .outerjoin(Task, (Task.goal_id == Goal.id) & (Task.day >= start_date))
         .where(Project.user_id == current_user.id)
-        .where((Task.date >= start_date) | (Task.date.is_(None)))
         .group_by(Project.id, Project.name, Project.color)
         .order_by(func.coalesce(func.sum(Task.actual_time_minutes), 0).desc())
     ).all()
@@ -212,4 +232,215 @@ def get_time_by_project(
             "time_logged_minutes": row.time_logged,
         }
         for row in result
-    ]
\ No newline at end of file
+    ]
+
+
+def _time_buckets(start: date, end: date, granularity: TimeGranularity) -> list[date]:
+    """
+    List the bucket start dates covering [start, end], aligned like date_trunc.
+    """
+    if granularity == TimeGranularity.WEEK:
+        current = start - timedelta(days=start.weekday())
+    elif granularity == TimeGranularity.MONTH:
+        current = start.replace(day=1)
+    else:
+        current = start
+
+    buckets = []
+    while current <= end:
+        buckets.append(current)
+        try:
+            if granularity == TimeGranularity.DAY:
+                current += timedelta(days=1)
+            elif granularity == TimeGranularity.WEEK:
+                current += timedelta(weeks=1)
+            elif current.month == 12:
+                current = current.replace(year=current.year + 1, month=1)
+            else:
+                current = current.replace(month=current.month + 1)
+        except (OverflowError, ValueError):
+            # The bucket holding date.max is the last one there is
+            break
+    return buckets
+
+
+@router.get(
+    "/time-series",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("dashboard-time-series")
+def get_time_series(
+    session: SessionDep,
+    current_user: CurrentUser,
+    date_from: Annotated[date | None, Query(alias="from")] = None,
+    date_to: Annotated[date | None, Query(alias="to")] = None,
+    granularity: TimeGranularity = TimeGranularity.DAY,
+    group_by: TimeSeriesGroupBy = TimeSeriesGroupBy.PROJECT,
+) -> Any:
+    """
+    Get time logged per project or goal, bucketed by day, week or month.
+
+    Defaults to the last 30 days, and ranges are limited to
+    MAX_TIME_SERIES_DAYS. The response is columnar: one list of bucket
+    dates, and per series one list of minutes aligned with it.
+    """
+    if date_to is None:
+        date_to = datetime.utcnow().date()
+    if date_from is None:
+        date_from = date_to - timedelta(days=min(29, (date_to - date.min).days))
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if (date_to - date_from).days >= MAX_TIME_SERIES_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range must be at most {MAX_TIME_SERIES_DAYS} days",
+        )
+
+    # Inline the (enum-validated) unit so SELECT and GROUP BY match textually
+    bucket = cast(
+        func.date_trunc(literal_column(f"'{granularity.value}'"), Task.day), Date
+    ).label("bucket")
+
+    # Tasks are outer-joined with the range in the join condition, so every
+    # project (or goal) is returned even without activity in the range
+    task_in_range = (
+        (Task.goal_id == Goal.id)
+        & (Task.day >= date_from)
+        & (Task.day <= date_to)
+    )
+    if group_by == TimeSeriesGroupBy.PROJECT:
+        series_columns = (Project.id, Project.name, Project.color)
+        statement = (
+            select(*series_columns)
+            .select_from(Project)
+            .outerjoin(Goal)
+            .outerjoin(Task, task_in_range)
+        )
+    else:
+        series_columns = (Goal.id, Goal.name, Project.color)
+        statement = (
+            select(*series_columns)
+            .select_from(Goal)
+            .join(Project)
+            .outerjoin(Task, task_in_range)
+        )
+
+    rows = session.exec(
+        statement.add_columns(
+            bucket,
+            func.coalesce(func.sum(Task.actual_time_minutes), 0).label("minutes"),
+        )
+        .where(Project.user_id == current_user.id)
+        .group_by(*series_columns, bucket)
+        .order_by(series_columns[1], series_columns[0])
+    ).all()
+
+    buckets = _time_buckets(date_from, date_to, granularity)
+    bucket_index = {bucket_start: i for i, bucket_start in enumerate(buckets)}
+
+    series: dict[Any, dict[str, Any]] = {}
+    for row in rows:
+        entry = series.setdefault(
+            row.id,
+            {
+                "id": str(row.id),
+                "name": row.name,
+                "color": row.color,
+                "values": [0] * len(buckets),
+                "total": 0,
+            },
+        )
+        if row.bucket is not None:
+            entry["values"][bucket_index[row.bucket]] += row.minutes
+            entry["total"] += row.minutes
+
+    return {
+        "from": date_from.isoformat(),
+        "to": date_to.isoformat(),
+        "granularity": granularity.value,
+        "group_by": group_by.value,
+        "buckets": [bucket_start.isoformat() for bucket_start in buckets],
+        "series": list(series.values()),
+    }
+
+
+def _pending_chores(
+    *, session: Session, user_id: uuid.UUID, target_date: date | None
+) -> ChoreLogsPublic:
+    instances = get_pending_chore_instances(
+        session=session,
+        user_id=user_id,
+        target_date=datetime.combine(target_date, time.min) if target_date else None,
+    )
+    return ChoreLogsPublic(
+        data=[ChoreLogPublic.model_validate(instance) for instance in instances],
+        count=len(instances),
+    )
+
+
+def _timed(
+    name: str, user: User, section: Callable[[Session, User], Any]
+) -> tuple[str, Any, float]:
+    """
+    Run one bundle section on its own session (and pooled connection).
+    """
+    started = perf_counter()
+    with Session(engine) as session:
+        result = section(session, user)
+    return name, result, (perf_counter() - started) * 1000
+
+
+@router.get(
+    "/bundle",
+    dependencies=[Depends(check_data_etag)],
+)
+def get_dashboard_bundle(
+    session: SessionDep,
+    response: Response,
+    current_user: CurrentUser,
+    days: int = 7,
+    target_date: date | None = None,
+) -> Any:
+    """
+    Get everything the dashboard page needs in one response: the summary,
+    time by project, the daily time summary and pending chore instances.
+
+    Sections run concurrently on separate connections and share the
+    per-endpoint response cache. Per-section durations are reported in the
+    Server-Timing header.
+    """
+    sections: dict[str, Callable[[Session, User], Any]] = {
+        "summary": lambda session, user: get_dashboard_summary(
+            session=session, current_user=user
+        ),
+        "time_by_project": lambda session, user: get_time_by_project(
+            session=session, current_user=user, days=days
+        ),
+        "daily_time_summary": lambda session, user: get_daily_time_summary(
+            session=session, current_user=user, target_date=target_date
+        ),
+        "pending_chores": lambda session, user: _pending_chores(
+            session=session, user_id=user.id, target_date=target_date
+        ),
+    }
+
+    # Give the request's connection back before waiting on the sections, so
+    # queued bundles don't hold connections the sections need. current_user
+    # stays usable with the attributes it has loaded.
+    session.close()
+
+    started = perf_counter()
+    futures = [
+        _bundle_executor.submit(_timed, name, current_user, section)
+        for name, section in sections.items()
+    ]
+    bundle = {}
+    timings = []
+    for future in futures:
+        name, result, duration = future.result()
+        bundle[name] = result
+        timings.append(f"{name.replace('_', '-')};dur={duration:.1f}")
+    timings.append(f"total;dur={(perf_counter() - started) * 1000:.1f}")
+
+    response.headers["Server-Timing"] = ", ".join(timings)
+    return bundle
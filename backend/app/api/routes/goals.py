@@ -1,11 +1,14 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import select
 
-from app.api.deps import CurrentUser, SessionDep
+from app import crud
+from app.api.deps import CurrentUser, OwnedGoal, SessionDep, check_data_etag
+from app.api.pagination import count_rows, paginate
 from app.models import (
+    CountMode,
     Goal,
     GoalCreate,
     GoalPublic,
@@ -13,63 +16,60 @@ from app.models import (
     GoalUpdate,
     Message,
     Project,
+    Task,
 )
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
 
-@router.get("/", response_model=GoalsPublic)
+@router.get(
+    "/",
+    response_model=GoalsPublic,
+    dependencies=[Depends(check_data_etag)],
+)
 def read_goals(
     session: SessionDep, 
     current_user: CurrentUser, 
     project_id: uuid.UUID | None = None,
+    cursor: str | None = None,
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    include_count: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     Retrieve goals for the current user, optionally filtered by project.
+    Pass the previous page's next_cursor to get the next page; skip is only
+    used without a cursor. include_count=estimate returns the planner's row
+    estimate and include_count=none skips counting.
     """
-    # Base query for user's goals through project relationship
-    base_query = (
-        select(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-    )
+    # Base query for user's goals
+    base_query = select(Goal).where(Goal.user_id == current_user.id)
     
     # Filter by project if specified
     if project_id:
         base_query = base_query.where(Goal.project_id == project_id)
     
     # Count query
-    count_statement = select(func.count()).select_from(base_query.subquery())
-    count = session.exec(count_statement).one()
+    count = count_rows(session, base_query, include_count)
     
     # Data query with pagination
-    statement = (
-        base_query
-        .offset(skip)
-        .limit(limit)
-        .order_by(Goal.created_at)
+    goals, next_cursor = paginate(
+        session,
+        base_query,
+        (Goal.created_at, Goal.id),
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
     )
-    goals = session.exec(statement).all()
 
-    return GoalsPublic(data=goals, count=count)
+    return GoalsPublic(data=goals, count=count, next_cursor=next_cursor)
 
 
 @router.get("/{id}", response_model=GoalPublic)
-def read_goal(session: SessionDep, current_user: CurrentUser, id: uuid.UUID) -> Any:
+def read_goal(goal: OwnedGoal) -> Any:
     """
     Get goal by ID.
     """
-    goal = session.get(Goal, id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    # Check if user owns the project that contains this goal
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
     return goal
 
 
@@ -102,7 +102,7 @@ def create_goal(
                 detail="Goal weekly time allocation cannot exceed project allocation"
             )
     
-    goal = Goal.model_validate(goal_in)
+    goal = Goal.model_validate(goal_in, update={"user_id": project.user_id})
     session.add(goal)
     session.commit()
     session.refresh(goal)
@@ -114,20 +114,13 @@ def update_goal(
     *,
     session: SessionDep,
     current_user: CurrentUser,
-    id: uuid.UUID,
+    goal: OwnedGoal,
     goal_in: GoalUpdate,
 ) -> Any:
     """
     Update a goal.
     """
-    goal = session.get(Goal, id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    # Check if user owns the project that contains this goal
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
+    project = goal.project
     
     # If updating project_id, verify the new project belongs to user
     if goal_in.project_id and goal_in.project_id != goal.project_id:
@@ -138,6 +131,8 @@ def update_goal(
     
     # Validate time allocation doesn't exceed project limits
     update_dict = goal_in.model_dump(exclude_unset=True)
+    # Keep the denormalized owner in step with the (possibly new) project
+    update_dict["user_id"] = project.user_id
     
     if "daily_time_allocated_minutes" in update_dict and update_dict["daily_time_allocated_minutes"] is not None:
         if update_dict["daily_time_allocated_minutes"] > project.daily_time_allocated_minutes:
@@ -162,20 +157,16 @@ def update_goal(
 
 @router.delete("/{id}")
 def delete_goal(
-    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+    session: SessionDep, current_user: CurrentUser, goal: OwnedGoal
 ) -> Message:
     """
     Delete a goal.
     """
-    goal = session.get(Goal, id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    # Check if user owns the project that contains this goal
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
+    # Cascaded deletes bypass the per-row rollup updates, so take the goal's
+    # tasks out of the rollup first
+    crud.remove_user_day_stats(
+        session=session, user_id=current_user.id, task_filter=Task.goal_id == goal.id
+    )
     session.delete(goal)
     session.commit()
     return Message(message="Goal deleted successfully")
\ No newline at end of file
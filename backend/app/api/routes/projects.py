@@ -1,46 +1,59 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import col, select
 
-from app.api.deps import CurrentUser, SessionDep
+from app import crud
+from app.api.deps import CurrentUser, SessionDep, check_data_etag
+from app.api.pagination import count_rows, paginate
 from app.models import (
+    CountMode,
+    Goal,
     Message,
     Project,
     ProjectCreate,
     ProjectPublic,
     ProjectsPublic,
     ProjectUpdate,
+    Task,
 )
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("/", response_model=ProjectsPublic)
+@router.get(
+    "/",
+    response_model=ProjectsPublic,
+    dependencies=[Depends(check_data_etag)],
+)
 def read_projects(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    current_user: CurrentUser,
+    cursor: str | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    include_count: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     Retrieve projects for the current user.
+    Pass the previous page's next_cursor to get the next page; skip is only
+    used without a cursor. include_count=estimate returns the planner's row
+    estimate and include_count=none skips counting.
     """
-    count_statement = (
-        select(func.count())
-        .select_from(Project)
-        .where(Project.user_id == current_user.id)
-    )
-    count = session.exec(count_statement).one()
+    base_query = select(Project).where(Project.user_id == current_user.id)
+    count = count_rows(session, base_query, include_count)
     
-    statement = (
-        select(Project)
-        .where(Project.user_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(Project.created_at)
+    projects, next_cursor = paginate(
+        session,
+        base_query,
+        (Project.created_at, Project.id),
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
     )
-    projects = session.exec(statement).all()
 
-    return ProjectsPublic(data=projects, count=count)
+    return ProjectsPublic(data=projects, count=count, next_cursor=next_cursor)
 
 
 @router.get("/{id}", response_model=ProjectPublic)
@@ -108,6 +121,15 @@ def delete_project(
     if project.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
+    # Cascaded deletes bypass the per-row rollup updates, so take the
+    # project's tasks out of the rollup first
+    crud.remove_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        task_filter=col(Task.goal_id).in_(
+            select(Goal.id).where(Goal.project_id == project.id)
+        ),
+    )
     session.delete(project)
     session.commit()
     return Message(message="Project deleted successfully")
\ No newline at end of file
@@ -1,43 +1,105 @@
 import uuid
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Body, Depends, HTTPException
+from sqlmodel import Session, col, select
 
-from app.api.deps import CurrentUser, SessionDep
+from app import crud
+from app.api.deps import CurrentUser, OwnedTask, SessionDep, check_data_etag
+from app.api.pagination import count_rows, paginate
 from app.models import (
+    CountMode,
     Goal,
     Message,
-    Project,
     Task,
+    TaskBulkResult,
+    TaskBulkResults,
+    TaskBulkUpdate,
     TaskCreate,
     TaskPublic,
     TasksPublic,
     TaskUpdate,
+    User,
 )
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Most tasks the /bulk endpoints take in one request
+MAX_BULK_TASKS = 500
 
-@router.get("/", response_model=TasksPublic)
+
+def _check_bulk_size(count: int) -> None:
+    if not count:
+        raise HTTPException(status_code=400, detail="No tasks given")
+    if count > MAX_BULK_TASKS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BULK_TASKS} tasks can be given"
+        )
+
+
+def _check_unique(ids: list[uuid.UUID]) -> None:
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Each task can only be given once")
+
+
+def _goal_owners(
+    session: Session, goal_ids: set[uuid.UUID]
+) -> dict[uuid.UUID, uuid.UUID]:
+    """
+    Owner of each of the goals that exist, in one query.
+    """
+    if not goal_ids:
+        return {}
+    rows = session.exec(
+        select(Goal.id, Goal.user_id).where(col(Goal.id).in_(goal_ids))
+    ).all()
+    return {goal_id: user_id for goal_id, user_id in rows}
+
+
+def _check_owner(
+    owner_id: uuid.UUID | None, current_user: User, not_found: str
+) -> None:
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+
+def _error_result(index: int, error: HTTPException) -> TaskBulkResult:
+    return TaskBulkResult(
+        index=index, status_code=error.status_code, detail=error.detail
+    )
+
+
+def _task_result(index: int, task: Task) -> TaskBulkResult:
+    return TaskBulkResult(
+        index=index, status_code=200, task=TaskPublic.model_validate(task)
+    )
+
+
+@router.get(
+    "/",
+    response_model=TasksPublic,
+    dependencies=[Depends(check_data_etag)],
+)
 def read_tasks(
     session: SessionDep, 
     current_user: CurrentUser, 
     goal_id: uuid.UUID | None = None,
     project_id: uuid.UUID | None = None,
+    cursor: str | None = None,
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    include_count: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     Retrieve tasks for the current user, optionally filtered by goal or project.
+    Pass the previous page's next_cursor to get the next page; skip is only
+    used without a cursor. include_count=estimate returns the planner's row
+    estimate and include_count=none skips counting.
     """
-    # Base query for user's tasks through goal -> project relationship
-    base_query = (
-        select(Task)
-        .join(Goal)
-        .join(Project)
-        .where(Project.user_id == current_user.id)
-    )
+    # Base query for user's tasks
+    base_query = select(Task).where(Task.user_id == current_user.id)
     
     # Filter by goal if specified
     if goal_id:
@@ -45,42 +107,29 @@ def read_tasks(
     
     # Filter by project if specified (through goal relationship)
     if project_id:
-        base_query = base_query.where(Goal.project_id == project_id)
+        base_query = base_query.join(Goal).where(Goal.project_id == project_id)
     
     # Count query
-    count_statement = select(func.count()).select_from(base_query.subquery())
-    count = session.exec(count_statement).one()
+    count = count_rows(session, base_query, include_count)
     
     # Data query with pagination
-    statement = (
-        base_query
-        .offset(skip)
-        .limit(limit)
-        .order_by(Task.date, Task.created_at)
+    tasks, next_cursor = paginate(
+        session,
+        base_query,
+        (Task.date, Task.created_at, Task.id),
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
     )
-    tasks = session.exec(statement).all()
 
-    return TasksPublic(data=tasks, count=count)
+    return TasksPublic(data=tasks, count=count, next_cursor=next_cursor)
 
 
 @router.get("/{id}", response_model=TaskPublic)
-def read_task(session: SessionDep, current_user: CurrentUser, id: uuid.UUID) -> Any:
+def read_task(task: OwnedTask) -> Any:
     """
     Get task by ID.
     """
-    task = session.get(Task, id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Check if user owns the project that contains this task's goal
-    goal = session.get(Goal, task.goal_id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
     return task
 
 
@@ -91,59 +140,170 @@ def create_task(
     """
     Create new task.
     """
-    # Verify the goal belongs to a project owned by the current user
+    # Verify the goal belongs to the current user
     goal = session.get(Goal, task_in.goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
-    
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
+    if goal.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    task = Task.model_validate(task_in)
+    task = Task.model_validate(task_in, update={"user_id": goal.user_id})
     session.add(task)
+    crud.update_user_day_stats(
+        session=session, user_id=current_user.id, changes=[crud.task_day_stats(task)]
+    )
     session.commit()
     session.refresh(task)
     return task
 
 
+@router.post("/bulk", response_model=TaskBulkResults)
+def create_tasks(
+    *, session: SessionDep, current_user: CurrentUser, tasks_in: list[TaskCreate]
+) -> Any:
+    """
+    Create several tasks at once, e.g. when planning a week.
+    Items whose goal is missing or not the user's get an error result and
+    are skipped; the others are created together.
+    """
+    _check_bulk_size(len(tasks_in))
+    goal_owners = _goal_owners(session, {task_in.goal_id for task_in in tasks_in})
+
+    results: list[TaskBulkResult] = []
+    tasks: list[Task] = []
+    for index, task_in in enumerate(tasks_in):
+        try:
+            _check_owner(
+                goal_owners.get(task_in.goal_id), current_user, "Goal not found"
+            )
+        except HTTPException as error:
+            results.append(_error_result(index, error))
+            continue
+        task = Task.model_validate(task_in, update={"user_id": current_user.id})
+        tasks.append(task)
+        results.append(_task_result(index, task))
+
+    if tasks:
+        crud.create_tasks(session=session, user_id=current_user.id, tasks=tasks)
+    return TaskBulkResults(data=results)
+
+
+@router.put("/bulk", response_model=TaskBulkResults)
+def update_tasks(
+    *, session: SessionDep, current_user: CurrentUser, tasks_in: list[TaskBulkUpdate]
+) -> Any:
+    """
+    Update several tasks at once.
+    Items whose task or new goal is missing or not the user's get an error
+    result and are skipped; the others are updated together.
+    """
+    ids = [task_in.id for task_in in tasks_in]
+    _check_bulk_size(len(ids))
+    _check_unique(ids)
+    tasks = {
+        task.id: task
+        for task in session.exec(select(Task).where(col(Task.id).in_(ids))).all()
+    }
+    goal_owners = _goal_owners(
+        session, {task_in.goal_id for task_in in tasks_in if task_in.goal_id}
+    )
+
+    results: list[TaskBulkResult] = []
+    changes: list[crud.DayStats] = []
+    for index, task_in in enumerate(tasks_in):
+        task = tasks.get(task_in.id)
+        try:
+            if task is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+            _check_owner(task.user_id, current_user, "Task not found")
+            if task_in.goal_id and task_in.goal_id != task.goal_id:
+                _check_owner(
+                    goal_owners.get(task_in.goal_id), current_user, "New goal not found"
+                )
+        except HTTPException as error:
+            results.append(_error_result(index, error))
+            continue
+        changes.append(crud.task_day_stats(task, sign=-1))
+        task.sqlmodel_update(task_in.model_dump(exclude_unset=True, exclude={"id"}))
+        session.add(task)
+        changes.append(crud.task_day_stats(task))
+        results.append(_task_result(index, task))
+
+    if changes:
+        # The updated rows are flushed together at commit
+        crud.update_user_day_stats(
+            session=session, user_id=current_user.id, changes=changes
+        )
+        session.commit()
+    return TaskBulkResults(data=results)
+
+
+@router.delete("/bulk", response_model=TaskBulkResults)
+def delete_tasks(
+    *,
+    session: SessionDep,
+    current_user: CurrentUser,
+    ids: Annotated[list[uuid.UUID], Body()],
+) -> Any:
+    """
+    Delete several tasks at once.
+    Items whose task is missing or not the user's get an error result and
+    are skipped; the others are deleted together.
+    """
+    _check_bulk_size(len(ids))
+    _check_unique(ids)
+    tasks = {
+        task.id: task
+        for task in session.exec(select(Task).where(col(Task.id).in_(ids))).all()
+    }
+
+    results: list[TaskBulkResult] = []
+    deleted: list[Task] = []
+    for index, id in enumerate(ids):
+        task = tasks.get(id)
+        try:
+            _check_owner(task.user_id if task else None, current_user, "Task not found")
+        except HTTPException as error:
+            results.append(_error_result(index, error))
+            continue
+        deleted.append(tasks[id])
+        results.append(_task_result(index, tasks[id]))
+
+    if deleted:
+        crud.delete_tasks(session=session, user_id=current_user.id, tasks=deleted)
+    return TaskBulkResults(data=results)
+
+
 @router.put("/{id}", response_model=TaskPublic)
 def update_task(
     *,
     session: SessionDep,
     current_user: CurrentUser,
-    id: uuid.UUID,
+    task: OwnedTask,
     task_in: TaskUpdate,
 ) -> Any:
     """
     Update a task.
     """
-    task = session.get(Task, id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Check if user owns the project that contains this task's goal
-    goal = session.get(Goal, task.goal_id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    # If updating goal_id, verify the new goal belongs to user's project
+    update_dict = task_in.model_dump(exclude_unset=True)
+
+    # If updating goal_id, verify the new goal belongs to the user
     if task_in.goal_id and task_in.goal_id != task.goal_id:
         new_goal = session.get(Goal, task_in.goal_id)
         if not new_goal:
             raise HTTPException(status_code=404, detail="New goal not found")
-        
-        new_project = session.get(Project, new_goal.project_id)
-        if not new_project or new_project.user_id != current_user.id:
+        if new_goal.user_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not enough permissions")
+        update_dict["user_id"] = new_goal.user_id
     
-    update_dict = task_in.model_dump(exclude_unset=True)
+    previous_stats = crud.task_day_stats(task, sign=-1)
     task.sqlmodel_update(update_dict)
     session.add(task)
+    crud.update_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        changes=[previous_stats, crud.task_day_stats(task)],
+    )
     session.commit()
     session.refresh(task)
     return task
@@ -151,24 +311,16 @@ def update_task(
 
 @router.delete("/{id}")
 def delete_task(
-    session: SessionDep, current_user: CurrentUser, id: uuid.UUID
+    session: SessionDep, current_user: CurrentUser, task: OwnedTask
 ) -> Message:
     """
     Delete a task.
     """
-    task = session.get(Task, id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Check if user owns the project that contains this task's goal
-    goal = session.get(Goal, task.goal_id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
+    crud.update_user_day_stats(
+        session=session,
+        user_id=current_user.id,
+        changes=[crud.task_day_stats(task, sign=-1)],
+    )
     session.delete(task)
     session.commit()
     return Message(message="Task deleted successfully")
@@ -187,22 +339,12 @@ def log_time_to_task(
     """
     if minutes <= 0:
         raise HTTPException(status_code=400, detail="Minutes must be positive")
-    
-    task = session.get(Task, id)
-    if not task:
+
+    owner_id, task = crud.log_time_to_task(
+        session=session, task_id=id, user_id=current_user.id, minutes=minutes
+    )
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Check if user owns the project that contains this task's goal
-    goal = session.get(Goal, task.goal_id)
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-    
-    project = session.get(Project, goal.project_id)
-    if not project or project.user_id != current_user.id:
+    if task is None:
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    task.actual_time_minutes += minutes
-    session.add(task)
-    session.commit()
-    session.refresh(task)
-    return task
\ No newline at end of file
+    return task
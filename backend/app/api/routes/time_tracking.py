@@ -1,17 +1,100 @@
-import uuid
-from datetime import datetime, date
-from typing import Any
+import calendar
+from datetime import datetime, date, timedelta
+from typing import Annotated, Any
 
-from fastapi import APIRouter
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import select
 
-from app.api.deps import CurrentUser, SessionDep
-from app.models import Goal, Project, Task
+from app import crud
+from app.api.deps import CurrentUser, SessionDep, check_data_etag
+from app.core.cache import cached_per_user
+from app.models import SummaryPeriod, UserDayStats
 
 router = APIRouter(prefix="/time-tracking", tags=["time-tracking"])
 
+# Longest custom range /summary accepts in one request
+MAX_SUMMARY_DAYS = 3 * 366
 
-@router.get("/daily-summary")
+
+def _week_end(week_start: date) -> date:
+    """
+    Last day of the week starting on week_start; 400 if that's past date.max.
+    """
+    if (date.max - week_start).days < 6:
+        raise HTTPException(status_code=400, detail="Date out of range")
+    return week_start + timedelta(days=6)
+
+
+def _with_limit_key(summary: dict[str, Any], key: str) -> list[dict[str, Any]]:
+    """Rename the engine's generic "limit" to a period-specific key."""
+    return [
+        {
+            **{k: v for k, v in project.items() if k not in ("limit", "goals")},
+            key: project["limit"],
+            "goals": [
+                {**{k: v for k, v in goal.items() if k != "limit"}, key: goal["limit"]}
+                for goal in project["goals"]
+            ],
+        }
+        for project in summary["projects"]
+    ]
+
+
+@router.get(
+    "/summary",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("time-tracking-summary")
+def get_time_summary(
+    session: SessionDep,
+    current_user: CurrentUser,
+    period: SummaryPeriod = SummaryPeriod.DAY,
+    from_date: Annotated[date | None, Query(alias="from")] = None,
+    to_date: Annotated[date | None, Query(alias="to")] = None,
+) -> Any:
+    """
+    Get time summary for projects and goals over a day, week, month or
+    custom range.
+
+    Day, week and month periods contain `from` (default today); weeks start
+    on Monday. Custom periods need both `from` and `to`, inclusive.
+    """
+    if period == SummaryPeriod.CUSTOM:
+        if from_date is None or to_date is None:
+            raise HTTPException(
+                status_code=400, detail="Custom periods need both from and to"
+            )
+        if from_date > to_date:
+            raise HTTPException(status_code=400, detail="from must not be after to")
+        if (to_date - from_date).days >= MAX_SUMMARY_DAYS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Date range must be at most {MAX_SUMMARY_DAYS} days",
+            )
+        start, end = from_date, to_date
+    else:
+        anchor = from_date or datetime.utcnow().date()
+        if period == SummaryPeriod.DAY:
+            start = end = anchor
+        elif period == SummaryPeriod.WEEK:
+            start = anchor - timedelta(days=anchor.weekday())
+            end = _week_end(start)
+        else:
+            start = anchor.replace(day=1)
+            end = anchor.replace(
+                day=calendar.monthrange(anchor.year, anchor.month)[1]
+            )
+
+    return crud.get_time_summary(
+        session=session, user_id=current_user.id, start=start, end=end, period=period
+    )
+
+
+@router.get(
+    "/daily-summary",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("time-tracking-daily-summary")
 def get_daily_time_summary(
     session: SessionDep, 
     current_user: CurrentUser,
@@ -21,74 +104,28 @@ def get_daily_time_summary(
     Get daily time summary for projects and goals.
     """
     if target_date is None:
-        target_date = date.today()
-    
-    # Get all user's projects
-    projects_statement = (
-        select(Project)
-        .where(Project.user_id == current_user.id)
+        target_date = datetime.utcnow().date()
+
+    summary = crud.get_time_summary(
+        session=session,
+        user_id=current_user.id,
+        start=target_date,
+        end=target_date,
+        period=SummaryPeriod.DAY,
     )
-    projects = session.exec(projects_statement).all()
-    
-    summary = []
-    
-    for project in projects:
-        # Get goals for this project
-        goals_statement = (
-            select(Goal)
-            .where(Goal.project_id == project.id)
-        )
-        goals = session.exec(goals_statement).all()
-        
-        # Calculate total time logged today for this project
-        project_time_logged = 0
-        goal_summaries = []
-        
-        for goal in goals:
-            # Get tasks for this goal on the target date
-            tasks_statement = (
-                select(Task)
-                .where(
-                    Task.goal_id == goal.id,
-                    func.date(Task.date) == target_date
-                )
-            )
-            tasks = session.exec(tasks_statement).all()
-            
-            goal_time_logged = sum(task.actual_time_minutes for task in tasks)
-            project_time_logged += goal_time_logged
-            
-            goal_summaries.append({
-                "goal_id": goal.id,
-                "goal_name": goal.name,
-                "daily_limit": goal.daily_time_allocated_minutes,
-                "time_logged": goal_time_logged,
-                "remaining": (goal.daily_time_allocated_minutes or 0) - goal_time_logged if goal.daily_time_allocated_minutes else None,
-                "percentage": (goal_time_logged / goal.daily_time_allocated_minutes * 100) if goal.daily_time_allocated_minutes else 0,
-                "is_over_limit": goal.daily_time_allocated_minutes and goal_time_logged > goal.daily_time_allocated_minutes,
-            })
-        
-        summary.append({
-            "project_id": project.id,
-            "project_name": project.name,
-            "project_color": project.color,
-            "daily_limit": project.daily_time_allocated_minutes,
-            "time_logged": project_time_logged,
-            "remaining": project.daily_time_allocated_minutes - project_time_logged,
-            "percentage": (project_time_logged / project.daily_time_allocated_minutes * 100) if project.daily_time_allocated_minutes else 0,
-            "is_over_limit": project_time_logged > project.daily_time_allocated_minutes,
-            "goals": goal_summaries,
-        })
-    
     return {
         "date": target_date,
-        "projects": summary,
-        "total_time_logged": sum(p["time_logged"] for p in summary),
-        "total_daily_limit": sum(p["daily_limit"] for p in summary),
+        "projects": _with_limit_key(summary, "daily_limit"),
+        "total_time_logged": summary["total_time_logged"],
+        "total_daily_limit": summary["total_limit"],
     }
 
 
-@router.get("/weekly-summary")
+@router.get(
+    "/weekly-summary",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("time-tracking-weekly-summary")
 def get_weekly_time_summary(
     session: SessionDep, 
     current_user: CurrentUser,
@@ -98,73 +135,107 @@ def get_weekly_time_summary(
     Get weekly time summary for projects and goals.
     """
     if week_start is None:
-        today = date.today()
-        week_start = today - datetime.timedelta(days=today.weekday())
-    
-    week_end = week_start + datetime.timedelta(days=6)
+        today = datetime.utcnow().date()
+        week_start = today - timedelta(days=today.weekday())
     
-    # Get all user's projects
-    projects_statement = (
-        select(Project)
-        .where(Project.user_id == current_user.id)
+    week_end = _week_end(week_start)
+
+    summary = crud.get_time_summary(
+        session=session,
+        user_id=current_user.id,
+        start=week_start,
+        end=week_end,
+        period=SummaryPeriod.WEEK,
     )
-    projects = session.exec(projects_statement).all()
-    
-    summary = []
-    
-    for project in projects:
-        # Get goals for this project
-        goals_statement = (
-            select(Goal)
-            .where(Goal.project_id == project.id)
-        )
-        goals = session.exec(goals_statement).all()
-        
-        # Calculate total time logged this week for this project
-        project_time_logged = 0
-        goal_summaries = []
-        
-        for goal in goals:
-            # Get tasks for this goal in the week range
-            tasks_statement = (
-                select(Task)
-                .where(
-                    Task.goal_id == goal.id,
-                    func.date(Task.date) >= week_start,
-                    func.date(Task.date) <= week_end
-                )
-            )
-            tasks = session.exec(tasks_statement).all()
-            
-            goal_time_logged = sum(task.actual_time_minutes for task in tasks)
-            project_time_logged += goal_time_logged
-            
-            goal_summaries.append({
-                "goal_id": goal.id,
-                "goal_name": goal.name,
-                "weekly_limit": goal.weekly_time_allocated_minutes,
-                "time_logged": goal_time_logged,
-                "remaining": (goal.weekly_time_allocated_minutes or 0) - goal_time_logged if goal.weekly_time_allocated_minutes else None,
-                "percentage": (goal_time_logged / goal.weekly_time_allocated_minutes * 100) if goal.weekly_time_allocated_minutes else 0,
-                "is_over_limit": goal.weekly_time_allocated_minutes and goal_time_logged > goal.weekly_time_allocated_minutes,
-            })
-        
-        summary.append({
-            "project_id": project.id,
-            "project_name": project.name,
-            "project_color": project.color,
-            "weekly_limit": project.weekly_time_allocated_minutes,
-            "time_logged": project_time_logged,
-            "remaining": project.weekly_time_allocated_minutes - project_time_logged,
-            "percentage": (project_time_logged / project.weekly_time_allocated_minutes * 100) if project.weekly_time_allocated_minutes else 0,
-            "is_over_limit": project_time_logged > project.weekly_time_allocated_minutes,
-            "goals": goal_summaries,
-        })
-    
     return {
         "week_start": week_start,
         "week_end": week_end,
-        "projects": summary,
-        "total_time_logged": sum(p["time_logged"] for p in summary),
-        "total_weekly_limit": sum(p["weekly_limit"] for p in summary),
-    }
\ No newline at end of file
+        "projects": _with_limit_key(summary, "weekly_limit"),
+        "total_time_logged": summary["total_time_logged"],
+        "total_weekly_limit": summary["total_limit"],
+    }
+
+
+def _streaks(active: list[bool], reference_index: int) -> tuple[int, int]:
+    """
+    Return (longest, current) runs of consecutive active days.
+    The current streak ends at reference_index; an inactive reference day
+    (e.g. today, not logged yet) doesn't break it.
+    """
+    longest = run = 0
+    for is_active in active:
+        run = run + 1 if is_active else 0
+        longest = max(longest, run)
+
+    current = 0
+    index = reference_index
+    if index >= 0 and not active[index]:
+        index -= 1
+    while index >= 0 and active[index]:
+        current += 1
+        index -= 1
+    return longest, current
+
+
+@router.get(
+    "/heatmap",
+    dependencies=[Depends(check_data_etag)],
+)
+@cached_per_user("time-tracking-heatmap")
+def get_activity_heatmap(
+    session: SessionDep,
+    current_user: CurrentUser,
+    year: int | None = Query(default=None, ge=1970, le=9999),
+) -> Any:
+    """
+    Get minutes logged per day of a year, for tasks and chores, plus streaks.
+
+    Read from the per-day rollup with one primary key range scan. Minutes
+    are returned as arrays with one entry per day of the year, starting on
+    January 1st.
+    """
+    today = datetime.utcnow().date()
+    if year is None:
+        year = today.year
+
+    start = date(year, 1, 1)
+    end = date(year, 12, 31)
+    days = (end - start).days + 1
+
+    rows = session.exec(
+        select(UserDayStats.day, UserDayStats.task_minutes, UserDayStats.chore_minutes)
+        .where(
+            UserDayStats.user_id == current_user.id,
+            UserDayStats.day >= start,
+            UserDayStats.day <= end,
+        )
+    ).all()
+
+    task_minutes = [0] * days
+    chore_minutes = [0] * days
+    for row in rows:
+        index = (row.day - start).days
+        task_minutes[index] = row.task_minutes
+        chore_minutes[index] = row.chore_minutes
+
+    active = [
+        tasks + chores > 0
+        for tasks, chores in zip(task_minutes, chore_minutes, strict=True)
+    ]
+    if today < start:
+        reference_index = -1
+    elif today > end:
+        reference_index = days - 1
+    else:
+        reference_index = (today - start).days
+    longest_streak, current_streak = _streaks(active, reference_index)
+
+    return {
+        "year": year,
+        "start": start,
+        "days": days,
+        "task_minutes": task_minutes,
+        "chore_minutes": chore_minutes,
+        "longest_streak": longest_streak,
+        "current_streak": current_streak,
+    }
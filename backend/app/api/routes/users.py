@@ -2,7 +2,7 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import col, delete, func, select
+from sqlmodel import col, delete, select
 
 from app import crud
 from app.api.deps import (
@@ -10,9 +10,11 @@ from app.api.deps import (
     SessionDep,
     get_current_active_superuser,
 )
+from app.api.pagination import count_rows, paginate
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 from app.models import (
+    CountMode,
     Item,
     Message,
     UpdatePassword,
@@ -34,18 +36,32 @@ router = APIRouter(prefix="/users", tags=["users"])
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
 )
-def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
+def read_users(
+    session: SessionDep,
+    cursor: str | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    include_count: CountMode = CountMode.EXACT,
+) -> Any:
     """
     Retrieve users.
+    Pass the previous page's next_cursor to get the next page; skip is only
+    used without a cursor. include_count=estimate returns the planner's row
+    estimate and include_count=none skips counting.
     """
 
-    count_statement = select(func.count()).select_from(User)
-    count = session.exec(count_statement).one()
+    count = count_rows(session, select(User), include_count)
 
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
+    users, next_cursor = paginate(
+        session,
+        select(User),
+        (User.created_at, User.id),
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
+    )
 
-    return UsersPublic(data=users, count=count)
+    return UsersPublic(data=users, count=count, next_cursor=next_cursor)
 
 
 @router.post(
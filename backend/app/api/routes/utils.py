@@ -1,7 +1,11 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.cache import response_cache
+from app.core.scheduler import chore_scheduler
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -29,3 +33,26 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/cache-stats/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def cache_stats() -> dict[str, Any]:
+    """
+    Hit/miss counters and size of this worker's response cache.
+    """
+    return response_cache.stats()
+
+
+@router.get(
+    "/chore-scheduler-runs/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def chore_scheduler_runs() -> list[dict[str, Any]]:
+    """
+    Recent nightly chore generation runs of this worker, newest first.
+    Only the worker holding the scheduler lock has any.
+    """
+    return list(reversed(chore_scheduler.runs))
@@ -0,0 +1,136 @@
+import functools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class ResponseCache:
+    """
+    In-process LRU cache with a per-entry TTL, keyed by (user_id, ...).
+
+    Entries are dropped per user when a transaction touching that user's
+    DailyOS rows commits (see app.core.changes). Invalidation only reaches
+    the worker process that ran the commit; other workers stop hitting their
+    entries because the user's data version is part of the key, and the
+    stale entries age out with their TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._keys_by_user: dict[uuid.UUID, set[tuple[Any, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: tuple[Any, ...], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def invalidate_users(self, user_ids: Iterable[uuid.UUID]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                for key in self._keys_by_user.pop(user_id, set()):
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def _discard(self, key: tuple[Any, ...]) -> None:
+        self._entries.pop(key, None)
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+
+response_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def cached_per_user(name: str) -> Callable[[F], F]:
+    """
+    Cache a route's return value per user, data version, query parameters
+    and UTC day.
+
+    The route must take current_user as a keyword argument. The data version
+    is part of the key so a worker never serves a body older than the ETag
+    built from it, and the day so defaults such as "today" or "this week"
+    roll over.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            user = kwargs["current_user"]
+            params = tuple(
+                sorted(
+                    (param, value)
+                    for param, value in kwargs.items()
+                    if param not in ("session", "current_user")
+                )
+            )
+            key = (
+                user.id,
+                name,
+                user.data_version,
+                datetime.utcnow().date(),
+                params,
+            )
+            found, value = response_cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            response_cache.set(key, value)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,60 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import event, update
+from sqlmodel import Session, col
+
+from app.core.cache import response_cache
+from app.models import Chore, ChoreLog, Goal, Project, Task, User
+
+CHANGED_USERS_KEY = "changed_user_ids"
+
+
+def mark_user_changed(session: Session, user_id: uuid.UUID) -> None:
+    """
+    Record that the current transaction changed a user's DailyOS data.
+    Needed for bulk statements that don't go through the ORM unit of work.
+    """
+    session.info.setdefault(CHANGED_USERS_KEY, set()).add(user_id)
+
+
+def _changed_user_ids(session: Session) -> set[uuid.UUID]:
+    # Every DailyOS table carries its owner's user_id, so no lookups needed
+    return {
+        obj.user_id
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Project | Goal | Task | Chore | ChoreLog)
+    }
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_users(
+    session: Session, _flush_context: Any, _instances: Any
+) -> None:
+    for user_id in _changed_user_ids(session):
+        mark_user_changed(session, user_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_data_versions(session: Session) -> None:
+    # Flush first so changes still pending at commit time are collected
+    session.flush()
+    user_ids = session.info.get(CHANGED_USERS_KEY)
+    if user_ids:
+        session.connection().execute(
+            update(User)
+            .where(col(User.id).in_(user_ids))
+            .values(data_version=User.data_version + 1)
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    user_ids = session.info.pop(CHANGED_USERS_KEY, None)
+    if user_ids:
+        response_cache.invalidate_users(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(CHANGED_USERS_KEY, None)
@@ -56,6 +56,10 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # Connections the engine keeps open, and how many more it may open
+    # under load
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -91,6 +95,17 @@ class Settings(BaseSettings):
     def emails_enabled(self) -> bool:
         return bool(self.SMTP_HOST and self.EMAILS_FROM_EMAIL)
 
+    # In-process cache for per-user dashboard and time tracking responses
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAXSIZE: int = 1024
+
+    # Nightly pre-generation of chore instances (see app.core.scheduler).
+    # Pending instances are computed on the fly, so it's only needed by
+    # clients that want a log row for every due chore
+    CHORE_SCHEDULER_ENABLED: bool = False
+    CHORE_SCHEDULER_MINUTES_AFTER_MIDNIGHT: int = 5
+    CHORE_SCHEDULER_BATCH_SIZE: int = 500
+
     EMAIL_TEST_USER: EmailStr = "test@example.com"
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
@@ -1,10 +1,15 @@
 from sqlmodel import Session, create_engine, select
 
 from app import crud
+from app.core import changes  # noqa: F401 - registers the session change hooks
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session, func, select
+
+from app import crud
+from app.core.config import settings
+from app.core.db import engine
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+# Application-wide key of the Postgres advisory lock that elects the leader
+CHORE_SCHEDULER_LOCK_ID = 4_417_202_614
+
+
+def seconds_until_next_run(now: datetime) -> float:
+    """Seconds from now (UTC) until the next nightly run is due."""
+    next_run = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        minutes=settings.CHORE_SCHEDULER_MINUTES_AFTER_MIDNIGHT
+    )
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+class ChoreScheduler:
+    """
+    Pre-generates each day's chore instances for every user shortly after
+    midnight (UTC), so the first request of the day doesn't pay for it.
+
+    Every worker process runs one. Only the worker holding the Postgres
+    advisory lock generates; it keeps the lock on a dedicated connection,
+    so if it dies the lock is released and another worker takes over at its
+    next run.
+    """
+
+    def __init__(self) -> None:
+        self.runs: deque[dict[str, Any]] = deque(maxlen=30)
+        self._lock_connection: Connection | None = None
+
+    def is_leader(self) -> bool:
+        if self._lock_connection is not None:
+            try:
+                self._lock_connection.exec_driver_sql("SELECT 1")
+                self._lock_connection.commit()
+                return True
+            except DBAPIError:
+                logger.warning("Lost the chore scheduler lock connection")
+                self.release()
+
+        connection = engine.connect()
+        acquired = connection.execute(
+            select(func.pg_try_advisory_lock(CHORE_SCHEDULER_LOCK_ID))
+        ).scalar()
+        # The lock is session level, don't keep a transaction open with it
+        connection.commit()
+        if acquired:
+            self._lock_connection = connection
+            return True
+        connection.close()
+        return False
+
+    def release(self) -> None:
+        if self._lock_connection is not None:
+            # Close the DBAPI connection rather than returning it to the
+            # pool, which would keep the lock held
+            self._lock_connection.invalidate()
+            self._lock_connection.close()
+            self._lock_connection = None
+
+    def run(self, target_date: datetime) -> dict[str, Any]:
+        """
+        Generate target_date's instances for all active users, in batches of
+        users with one statement and commit each.
+        """
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        users = batches = created = 0
+        last_user_id = None
+        with Session(engine) as session:
+            while True:
+                statement = (
+                    select(User.id)
+                    .where(User.is_active == True)
+                    .order_by(User.id)
+                    .limit(settings.CHORE_SCHEDULER_BATCH_SIZE)
+                )
+                if last_user_id is not None:
+                    statement = statement.where(User.id > last_user_id)
+                user_ids = list(session.exec(statement).all())
+                if not user_ids:
+                    break
+                created += crud.generate_chore_instances_for_users(
+                    session=session, user_ids=user_ids, target_date=target_date
+                )
+                users += len(user_ids)
+                batches += 1
+                last_user_id = user_ids[-1]
+
+        run = {
+            "date": target_date.date(),
+            "started_at": started_at,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "users": users,
+            "batches": batches,
+            "chore_logs_created": created,
+        }
+        self.runs.append(run)
+        logger.info(
+            "Generated %s chore logs for %s users in %s batches (%s ms)",
+            created,
+            users,
+            batches,
+            run["duration_ms"],
+        )
+        return run
+
+    async def run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(seconds_until_next_run(datetime.utcnow()))
+            try:
+                if await asyncio.to_thread(self.is_leader):
+                    await asyncio.to_thread(self.run, datetime.utcnow())
+            except Exception:
+                logger.exception("Nightly chore generation failed")
+
+
+chore_scheduler = ChoreScheduler()
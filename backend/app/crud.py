@@ -1,13 +1,23 @@
 import uuid
+from collections.abc import Sequence
 from typing import Any
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from sqlmodel import Session, select
+from sqlalchemy import (
+    Date, DateTime, Integer, Uuid, any_, case, cast, column, delete, extract, false,
+    inspect, literal, literal_column, or_, true, tuple_, union_all, update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, func, select
 
+from app.core.changes import mark_user_changed
 from app.core.security import get_password_hash, verify_password
 from app.models import (
     Item, ItemCreate, User, UserCreate, UserUpdate,
-    Chore, ChoreLog, ChoreFrequency
+    Chore, ChoreLog, ChoreFrequency,
+    Goal, Project, SummaryPeriod, Task, TaskPublic, TaskStatus, UserDayStats
 )
 
 
@@ -58,54 +68,406 @@ def create_item(*, session: Session, item_in: ItemCreate, owner_id: uuid.UUID) -
     return db_item
 
 
-def get_chores_needing_instances(*, session: Session, user_id: uuid.UUID, target_date: datetime) -> list[Chore]:
+DayStats = tuple[date, dict[str, int]]
+
+USER_DAY_STATS_COLUMNS = [
+    "tasks_total", "tasks_done", "task_minutes", "chore_count", "chore_minutes"
+]
+
+
+def task_day_stats(task: Task, sign: int = 1) -> DayStats:
+    """
+    Return the day a task counts towards and its contribution to that day.
+    Use sign=-1 to get the contribution to remove.
+    """
+    return task.date.date(), {
+        "tasks_total": sign,
+        "tasks_done": sign if task.status == TaskStatus.DONE else 0,
+        "task_minutes": sign * task.actual_time_minutes,
+    }
+
+
+def chore_log_day_stats(chore_log: ChoreLog, sign: int = 1) -> DayStats:
+    """
+    Return the day a chore log counts towards and its contribution to that day.
+    Use sign=-1 to get the contribution to remove.
     """
-    Get active chores that need instances generated for the target date.
+    return chore_log.date.date(), {
+        "chore_count": sign,
+        "chore_minutes": sign * chore_log.actual_time_minutes,
+    }
+
+
+def update_user_day_stats(
+    *, session: Session, user_id: uuid.UUID, changes: list[DayStats]
+) -> None:
     """
-    statement = select(Chore).where(
-        Chore.user_id == user_id,
-        Chore.is_active == True
+    Apply deltas to a user's daily rollup rows in a single upsert.
+    Deltas for the same day are merged and no-op changes are skipped.
+    """
+    merged: dict[date, dict[str, int]] = {}
+    for day, deltas in changes:
+        day_deltas = merged.setdefault(day, {})
+        for key, value in deltas.items():
+            day_deltas[key] = day_deltas.get(key, 0) + value
+
+    columns = USER_DAY_STATS_COLUMNS
+    rows = [
+        {"user_id": user_id, "day": day, **{c: deltas.get(c, 0) for c in columns}}
+        for day, deltas in merged.items()
+        if any(deltas.values())
+    ]
+    if not rows:
+        return
+
+    statement = insert(UserDayStats).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[UserDayStats.user_id, UserDayStats.day],
+        set_={c: getattr(UserDayStats, c) + statement.excluded[c] for c in columns},
     )
-    chores = session.exec(statement).all()
-    
-    chores_needing_instances = []
-    
-    for chore in chores:
-        if should_generate_chore_instance(session=session, chore=chore, target_date=target_date):
-            chores_needing_instances.append(chore)
-    
-    return chores_needing_instances
+    session.exec(statement)  # type: ignore
 
 
-def should_generate_chore_instance(*, session: Session, chore: Chore, target_date: datetime) -> bool:
+def _day_stats_totals(*, task_filter: Any, chore_log_filter: Any) -> Any:
     """
-    Determine if a chore instance should be generated for the target date.
+    SELECT of the rollup columns per (user_id, day), summed over the tasks
+    and chore logs matching the filters.
     """
-    # Check if there's already a log for this date
-    existing_log = session.exec(
-        select(ChoreLog).where(
-            ChoreLog.chore_id == chore.id,
-            ChoreLog.date >= target_date.replace(hour=0, minute=0, second=0, microsecond=0),
-            ChoreLog.date < target_date.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    task_rows = (
+        select(
+            Task.user_id.label("user_id"),
+            Task.day.label("day"),
+            literal(1).label("tasks_total"),
+            case((Task.status == TaskStatus.DONE, 1), else_=0).label("tasks_done"),
+            Task.actual_time_minutes.label("task_minutes"),
+            literal(0).label("chore_count"),
+            literal(0).label("chore_minutes"),
+        )
+        .where(task_filter)
+    )
+    chore_rows = (
+        select(
+            ChoreLog.user_id.label("user_id"),
+            ChoreLog.day.label("day"),
+            literal(0).label("tasks_total"),
+            literal(0).label("tasks_done"),
+            literal(0).label("task_minutes"),
+            literal(1).label("chore_count"),
+            ChoreLog.actual_time_minutes.label("chore_minutes"),
+        )
+        .where(chore_log_filter)
+    )
+    activity = union_all(task_rows, chore_rows).subquery("activity")
+    return select(
+        activity.c.user_id,
+        activity.c.day,
+        *[func.sum(activity.c[c]).label(c) for c in USER_DAY_STATS_COLUMNS],
+    ).group_by(activity.c.user_id, activity.c.day)
+
+
+def rebuild_user_day_stats(*, session: Session, user_id: uuid.UUID | None = None) -> None:
+    """
+    Recompute daily rollup rows from the task and chore log tables.
+    Rebuilds a single user's rows when user_id is given, otherwise everyone's.
+    Does not commit.
+    """
+    clear_statement = delete(UserDayStats)
+    task_filter: Any = true()
+    chore_log_filter: Any = true()
+    if user_id is not None:
+        task_filter = Task.user_id == user_id
+        chore_log_filter = ChoreLog.user_id == user_id
+        clear_statement = clear_statement.where(UserDayStats.user_id == user_id)
+
+    totals = _day_stats_totals(
+        task_filter=task_filter, chore_log_filter=chore_log_filter
+    )
+    session.exec(clear_statement)  # type: ignore
+    session.exec(  # type: ignore
+        insert(UserDayStats).from_select(
+            ["user_id", "day", *USER_DAY_STATS_COLUMNS], totals
+        )
+    )
+
+
+def remove_user_day_stats(
+    *,
+    session: Session,
+    user_id: uuid.UUID,
+    task_filter: Any = None,
+    chore_log_filter: Any = None,
+) -> None:
+    """
+    Subtract the rollup contribution of a user's tasks and chore logs that
+    match the filters (none if a filter is not given), e.g. before deleting
+    the project, goal or chore they cascade from. Only reads those rows,
+    grouped by day. Doesn't commit.
+    """
+    totals = session.exec(
+        _day_stats_totals(
+            task_filter=(Task.user_id == user_id)
+            & (false() if task_filter is None else task_filter),
+            chore_log_filter=(ChoreLog.user_id == user_id)
+            & (false() if chore_log_filter is None else chore_log_filter),
+        )
+    ).all()
+    update_user_day_stats(
+        session=session,
+        user_id=user_id,
+        changes=[
+            (row.day, {c: -getattr(row, c) for c in USER_DAY_STATS_COLUMNS})
+            for row in totals
+        ],
+    )
+
+
+def log_time_to_task(
+    *, session: Session, task_id: uuid.UUID, user_id: uuid.UUID, minutes: int
+) -> tuple[uuid.UUID | None, TaskPublic | None]:
+    """
+    Add minutes to a task's actual time in a single statement, returning
+    (owner_id, task). The increment happens in the database, so concurrent
+    timers don't lose time, and only when the task is the user's: owner_id is
+    None if the task doesn't exist and task is None if it isn't the user's.
+    """
+    owner = (
+        select(Task.id, Task.user_id.label("owner_id"))
+        .where(Task.id == task_id)
+        .cte("owner")
+    )
+    updated = (
+        update(Task)
+        .where(Task.id == owner.c.id, owner.c.owner_id == user_id)
+        .values(actual_time_minutes=Task.actual_time_minutes + minutes)
+        .returning(*Task.__table__.c)
+        .cte("updated")
+    )
+    row = session.exec(
+        select(owner.c.owner_id, updated).select_from(
+            owner.outerjoin(updated, true())
         )
     ).first()
-    
-    if existing_log:
-        return False
-    
-    # Check frequency requirements
-    if chore.frequency == ChoreFrequency.DAILY:
-        return True
-    
-    elif chore.frequency == ChoreFrequency.WEEKLY:
-        # Generate on Mondays (weekday 0)
-        return target_date.weekday() == 0
-    
-    elif chore.frequency == ChoreFrequency.MONTHLY:
-        # Generate on the 1st of each month
-        return target_date.day == 1
-    
-    return False
+    if row is None:
+        return None, None
+    if row.id is None:
+        return row.owner_id, None
+
+    task = TaskPublic.model_validate(row._mapping)
+    update_user_day_stats(
+        session=session,
+        user_id=user_id,
+        changes=[(task.date.date(), {"task_minutes": minutes})],
+    )
+    mark_user_changed(session, user_id)
+    session.commit()
+    return row.owner_id, task
+
+
+def create_tasks(*, session: Session, user_id: uuid.UUID, tasks: list[Task]) -> None:
+    """
+    Insert a user's new tasks with a single multi-row INSERT and add them to
+    the daily rollup, in one transaction.
+    """
+    session.exec(  # type: ignore
+        insert(Task).values([task.model_dump(exclude={"day"}) for task in tasks])
+    )
+    update_user_day_stats(
+        session=session,
+        user_id=user_id,
+        changes=[task_day_stats(task) for task in tasks],
+    )
+    mark_user_changed(session, user_id)
+    session.commit()
+
+
+def delete_tasks(*, session: Session, user_id: uuid.UUID, tasks: list[Task]) -> None:
+    """
+    Delete a user's tasks with a single DELETE and take them off the daily
+    rollup, in one transaction.
+    """
+    update_user_day_stats(
+        session=session,
+        user_id=user_id,
+        changes=[task_day_stats(task, sign=-1) for task in tasks],
+    )
+    session.exec(  # type: ignore
+        delete(Task)
+        .where(col(Task.id).in_([task.id for task in tasks]))
+        .execution_options(synchronize_session=False)
+    )
+    mark_user_changed(session, user_id)
+    session.commit()
+
+
+def chore_is_due(day: Any) -> Any:
+    """
+    SQL condition for a chore being due on `day`, a date expression, by its
+    recurrence rule (see ChoreBase).
+    """
+    month_start = func.date_trunc("month", cast(day, DateTime))
+    last_day_of_month = extract(
+        "day", month_start + literal_column("interval '1 month - 1 day'")
+    )
+    return or_(
+        (Chore.frequency == ChoreFrequency.DAILY)
+        & ((day - cast(Chore.created_at, Date)) % Chore.interval_days == 0),
+        (Chore.frequency == ChoreFrequency.WEEKLY)
+        & (cast(extract("isodow", day), Integer) - 1 == any_(Chore.weekdays)),
+        (Chore.frequency == ChoreFrequency.MONTHLY)
+        & (extract("day", day) == func.least(Chore.month_day, last_day_of_month)),
+    )
+
+
+def chore_next_due(on_or_after: date) -> Any:
+    """
+    SQL scalar subquery, correlated to chore: the start of the first day on or
+    after `on_or_after` the chore is due.
+    """
+    start = literal(on_or_after, Date)
+    # No rule leaves a gap longer than a month or the chore's interval
+    window = func.greatest(Chore.interval_days, 31)
+    days = func.generate_series(
+        cast(start, DateTime),
+        cast(start + window - 1, DateTime),
+        literal_column("interval '1 day'"),
+    ).table_valued("value").render_derived()
+    return (
+        select(func.min(days.c.value))
+        .select_from(days)
+        .where(chore_is_due(cast(days.c.value, Date)))
+        .correlate(Chore)
+        .scalar_subquery()
+    )
+
+
+def reschedule_chores(
+    *, session: Session, chore_ids: list[uuid.UUID], from_date: date
+) -> None:
+    """
+    Set next_due_at to the first due day on or after from_date, e.g. after a
+    chore is created, its rule changes or it is reactivated. Doesn't commit.
+    """
+    session.exec(  # type: ignore
+        update(Chore)
+        .where(col(Chore.id).in_(chore_ids))
+        .values(next_due_at=chore_next_due(from_date))
+    )
+
+
+def _insert_chore_logs(chore_days: Any) -> Any:
+    """
+    INSERT ... SELECT of a pending log (actual_time_minutes = 0) for every
+    (chore_id, user_id, date) row of chore_days.
+    """
+    rows = chore_days.subquery()
+    # Days that already have a log are skipped by the unique (chore_id, day)
+    # index, which also makes concurrent runs from several workers safe
+    return (
+        insert(ChoreLog)
+        .from_select(
+            ["id", "chore_id", "user_id", "date", "actual_time_minutes", "created_at"],
+            select(
+                func.gen_random_uuid(),
+                rows.c.chore_id,
+                rows.c.user_id,
+                rows.c.date,
+                literal(0),
+                literal(datetime.utcnow()),
+            ),
+        )
+        .on_conflict_do_nothing(index_elements=[ChoreLog.chore_id, ChoreLog.day])
+    )
+
+
+def _advance_due_chores(*, users: Any, target_date: datetime) -> Any:
+    """
+    CTE moving next_due_at past target_date for the matching users' active
+    chores that are due (or overdue) by then, returning (chore_id, user_id).
+    Served by the chore (user_id, next_due_at) index.
+    """
+    next_day = target_date + timedelta(days=1)
+    return (
+        update(Chore)
+        .where(users, Chore.is_active == True, Chore.next_due_at < next_day)
+        .values(next_due_at=chore_next_due(next_day.date()))
+        .returning(Chore.id.label("chore_id"), Chore.user_id)
+        .cte("due_chores")
+    )
+
+
+def _commit_created_logs(
+    *, session: Session, user_id: uuid.UUID, created_instances: Sequence[ChoreLog]
+) -> list[ChoreLog]:
+    if created_instances:
+        update_user_day_stats(
+            session=session,
+            user_id=user_id,
+            changes=[chore_log_day_stats(log) for log in created_instances],
+        )
+        mark_user_changed(session, user_id)
+        # The RETURNING rows are fully loaded; detach them so the commit
+        # doesn't expire them and cost a refresh per row
+        for instance in created_instances:
+            session.expunge(instance)
+    session.commit()
+    return sorted(created_instances, key=lambda log: log.date)
+
+
+def generate_chore_instances_for_users(
+    *, session: Session, user_ids: list[uuid.UUID], target_date: datetime
+) -> int:
+    """
+    Generate and commit the day's chore instances for many users at once.
+    Logs and rollup rows are written by one statement; returns the number
+    of logs created.
+    """
+    target_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    due_chores = _advance_due_chores(
+        users=col(Chore.user_id).in_(user_ids), target_date=target_date
+    )
+    created = (
+        _insert_chore_logs(
+            select(
+                due_chores.c.chore_id,
+                due_chores.c.user_id,
+                literal(target_date).label("date"),
+            )
+        )
+        .returning(ChoreLog.user_id)
+        .cte("created")
+    )
+    per_user = (
+        select(created.c.user_id, func.count().label("chore_count"))
+        .group_by(created.c.user_id)
+        .cte("per_user")
+    )
+    # Every rollup column is selected: the ones left out would be inserted
+    # as NULL, and NOT NULL is checked before ON CONFLICT
+    stats = insert(UserDayStats).from_select(
+        ["user_id", "day", *USER_DAY_STATS_COLUMNS],
+        select(
+            per_user.c.user_id,
+            literal(target_date.date()),
+            *[
+                per_user.c.chore_count if c == "chore_count" else literal(0)
+                for c in USER_DAY_STATS_COLUMNS
+            ],
+        ),
+    )
+    stats = stats.on_conflict_do_update(
+        index_elements=[UserDayStats.user_id, UserDayStats.day],
+        set_={"chore_count": UserDayStats.chore_count + stats.excluded.chore_count},
+    )
+    rows = session.exec(
+        select(per_user.c.user_id, per_user.c.chore_count).add_cte(
+            stats.cte("stats")
+        )
+    ).all()
+
+    for user_id, _ in rows:
+        mark_user_changed(session, user_id)
+    session.commit()
+    return sum(chore_count for _, chore_count in rows)
 
 
 def generate_chore_instances(*, session: Session, user_id: uuid.UUID, target_date: datetime | None = None) -> list[ChoreLog]:
@@ -118,74 +480,252 @@ def generate_chore_instances(*, session: Session, user_id: uuid.UUID, target_dat
     
     # Normalize target_date to start of day
     target_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    chores_needing_instances = get_chores_needing_instances(
-        session=session, 
-        user_id=user_id, 
-        target_date=target_date
+
+    # Chores due (or overdue) by the target date get a log on that day and
+    # their next_due_at moved on, in one statement
+    due_chores = _advance_due_chores(
+        users=Chore.user_id == user_id, target_date=target_date
     )
-    
-    created_instances = []
-    
-    for chore in chores_needing_instances:
-        # Create a ChoreLog instance (not completed yet, actual_time_minutes = 0)
-        chore_log = ChoreLog(
-            chore_id=chore.id,
-            date=target_date,
-            actual_time_minutes=0  # Not completed yet
+    statement = _insert_chore_logs(
+        select(
+            due_chores.c.chore_id,
+            due_chores.c.user_id,
+            literal(target_date).label("date"),
         )
-        
-        session.add(chore_log)
-        created_instances.append(chore_log)
-    
-    if created_instances:
-        session.commit()
-        for instance in created_instances:
-            session.refresh(instance)
-    
-    return created_instances
+    ).returning(*ChoreLog.__table__.columns)  # type: ignore[attr-defined]
+    created_instances = session.scalars(
+        select(ChoreLog).from_statement(statement)
+    ).all()
+
+    return _commit_created_logs(
+        session=session, user_id=user_id, created_instances=created_instances
+    )
+
+
+def virtual_chore_instance_id(chore_id: uuid.UUID, day: date) -> uuid.UUID:
+    """
+    Stable id of a chore's not yet materialized instance on a day; the log
+    written when it's completed gets the same id.
+    """
+    return uuid.uuid5(chore_id, day.isoformat())
 
 
 def get_pending_chore_instances(*, session: Session, user_id: uuid.UUID, target_date: datetime | None = None) -> list[ChoreLog]:
     """
     Get chore instances that are pending completion for the target date.
-    Pending means actual_time_minutes = 0.
+
+    Chores due (or overdue) by the target date without a log that day are
+    returned as virtual instances: unsaved ChoreLogs with actual_time_minutes
+    = 0, only written when completed. Logs pre-generated with
+    actual_time_minutes = 0 are returned as they are.
     """
     if target_date is None:
         target_date = datetime.utcnow()
-    
-    # Normalize to start of day
-    start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_day = start_of_day + timedelta(days=1)
-    
+    day = target_date.date()
+    next_day = datetime.combine(day + timedelta(days=1), datetime.min.time())
+
+    # Pre-generated pending logs come from the partial index on pending rows;
+    # the check for any log that day only needs the unique (chore_id, day)
+    # index, so completed logs are never read from the table
+    day_log = aliased(ChoreLog)
+    has_log = (
+        select(literal(1))
+        .where(day_log.chore_id == Chore.id, day_log.day == day)
+        .exists()
+    )
     statement = (
-        select(ChoreLog)
-        .join(Chore)
+        select(Chore, ChoreLog)
+        .outerjoin(
+            ChoreLog,
+            (ChoreLog.chore_id == Chore.id)
+            & (ChoreLog.day == day)
+            # Inlined rather than bound, so the planner can match the
+            # partial index predicate even with a generic plan
+            & (ChoreLog.actual_time_minutes == literal_column("0")),
+        )
         .where(
             Chore.user_id == user_id,
-            ChoreLog.date >= start_of_day,
-            ChoreLog.date < end_of_day,
-            ChoreLog.actual_time_minutes == 0
+            or_(
+                col(ChoreLog.id).is_not(None),
+                (Chore.is_active == True)
+                & (Chore.next_due_at < next_day)
+                & ~has_log,
+            ),
         )
+        .order_by(Chore.created_at)
+    )
+
+    return [
+        chore_log
+        or ChoreLog(
+            id=virtual_chore_instance_id(chore.id, day),
+            chore_id=chore.id,
+            user_id=chore.user_id,
+            date=datetime.combine(day, datetime.min.time()),
+            actual_time_minutes=0,
+        )
+        for chore, chore_log in session.exec(statement).all()
+    ]
+
+
+def advance_chores_past(
+    *, session: Session, chore_ids: list[uuid.UUID], day: date
+) -> None:
+    """
+    Reschedule the chores that are due by `day` to their first due day after
+    it, e.g. once they have been done that day. Doesn't commit.
+    """
+    next_day = day + timedelta(days=1)
+    session.exec(  # type: ignore
+        update(Chore)
+        .where(
+            col(Chore.id).in_(chore_ids),
+            Chore.next_due_at < datetime.combine(next_day, datetime.min.time()),
+        )
+        .values(next_due_at=chore_next_due(next_day))
     )
-    
-    return session.exec(statement).all()
 
 
-def complete_chore_instance(*, session: Session, chore_log_id: uuid.UUID, actual_time_minutes: int) -> ChoreLog | None:
+def reopen_chore_day(
+    *, session: Session, chore_id: uuid.UUID, day: date, log_id: uuid.UUID
+) -> None:
+    """
+    Make a chore due again from `day` once its log that day (log_id) is
+    deleted or moved to another day, unless another log after `day` has
+    already moved it on. Doesn't commit.
+    """
+    later_log = (
+        select(literal(1))
+        .where(
+            ChoreLog.chore_id == Chore.id,
+            ChoreLog.id != log_id,
+            ChoreLog.day > day,
+        )
+        .exists()
+    )
+    session.exec(  # type: ignore
+        update(Chore)
+        .where(col(Chore.id) == chore_id, ~later_log)
+        .values(next_due_at=func.least(Chore.next_due_at, chore_next_due(day)))
+    )
+
+
+def _insert_completed_logs(
+    *, session: Session, completions: list[tuple[ChoreLog, int]]
+) -> bool:
+    """
+    Write completed virtual instances, given as (instance, minutes), with one
+    INSERT. Returns False, having rolled back, if any of them has been
+    written in the meantime (e.g. completed twice at once).
+    """
+    inserted = session.exec(  # type: ignore
+        insert(ChoreLog)
+        .values([
+            {
+                "id": log.id,
+                "chore_id": log.chore_id,
+                "user_id": log.user_id,
+                "date": log.date,
+                "actual_time_minutes": minutes,
+                "created_at": log.created_at,
+            }
+            for log, minutes in completions
+        ])
+        # Either the id or the (chore_id, day) index can conflict
+        .on_conflict_do_nothing()
+        .returning(col(ChoreLog.id))
+    ).all()
+    if len(inserted) < len(completions):
+        session.rollback()
+        return False
+    return True
+
+
+def complete_chore_instance(
+    *, session: Session, chore_log: ChoreLog, actual_time_minutes: int
+) -> ChoreLog | None:
     """
     Mark a chore instance as completed by setting the actual time.
+    Virtual instances are written now; the chore's next due day moves past
+    the instance's day. Returns None if a virtual instance has already been
+    written by a concurrent completion.
     """
-    chore_log = session.get(ChoreLog, chore_log_id)
-    if not chore_log:
+    day = chore_log.date.date()
+    if inspect(chore_log).has_identity:
+        previous_stats = chore_log_day_stats(chore_log, sign=-1)
+        chore_log.actual_time_minutes = actual_time_minutes
+        session.add(chore_log)
+    else:
+        previous_stats = (day, {})
+        if not _insert_completed_logs(
+            session=session, completions=[(chore_log, actual_time_minutes)]
+        ):
+            return None
+        chore_log.actual_time_minutes = actual_time_minutes
+
+    update_user_day_stats(
+        session=session,
+        user_id=chore_log.user_id,
+        changes=[previous_stats, chore_log_day_stats(chore_log)],
+    )
+    advance_chores_past(session=session, chore_ids=[chore_log.chore_id], day=day)
+    mark_user_changed(session, chore_log.user_id)
+    session.commit()
+    return session.get(ChoreLog, chore_log.id, populate_existing=True)
+
+
+def complete_chore_instances(
+    *,
+    session: Session,
+    user_id: uuid.UUID,
+    completions: list[tuple[ChoreLog, int]],
+) -> list[ChoreLog] | None:
+    """
+    Complete several of a user's chore instances, given as (instance, minutes),
+    in one transaction. Existing logs are updated with a single
+    UPDATE ... FROM (VALUES ...) and virtual instances written with a single
+    INSERT. Returns None, without completing any, if a virtual instance has
+    already been written by a concurrent completion.
+    """
+    existing: list[tuple[ChoreLog, int]] = []
+    virtual: list[tuple[ChoreLog, int]] = []
+    for log, minutes in completions:
+        (existing if inspect(log).has_identity else virtual).append((log, minutes))
+
+    # Virtual instances first, so nothing else is written if one conflicts
+    if virtual and not _insert_completed_logs(session=session, completions=virtual):
         return None
-    
-    chore_log.actual_time_minutes = actual_time_minutes
-    session.add(chore_log)
+    if existing:
+        completed = values(
+            column("id", Uuid), column("actual_time_minutes", Integer), name="completed"
+        ).data([(log.id, minutes) for log, minutes in existing])
+        session.exec(  # type: ignore
+            update(ChoreLog)
+            .where(ChoreLog.id == completed.c.id)
+            .values(actual_time_minutes=completed.c.actual_time_minutes)
+            .execution_options(synchronize_session=False)
+        )
+
+    changes = [chore_log_day_stats(log, sign=-1) for log, _ in existing]
+    chore_ids_by_day: dict[date, list[uuid.UUID]] = {}
+    for log, minutes in completions:
+        day = log.date.date()
+        changes.append((day, {"chore_count": 1, "chore_minutes": minutes}))
+        chore_ids_by_day.setdefault(day, []).append(log.chore_id)
+    update_user_day_stats(session=session, user_id=user_id, changes=changes)
+    for day, chore_ids in chore_ids_by_day.items():
+        advance_chores_past(session=session, chore_ids=chore_ids, day=day)
+    mark_user_changed(session, user_id)
     session.commit()
-    session.refresh(chore_log)
-    
-    return chore_log
+
+    return list(
+        session.exec(
+            select(ChoreLog)
+            .where(col(ChoreLog.id).in_([log.id for log, _ in completions]))
+            .order_by(ChoreLog.date, ChoreLog.created_at)
+            .execution_options(populate_existing=True)
+        ).all()
+    )
 
 
 def generate_chore_instances_for_date_range(
@@ -199,16 +739,173 @@ def generate_chore_instances_for_date_range(
     Generate chore instances for a range of dates.
     Useful for bulk generation or catching up on missed days.
     """
-    all_created_instances = []
-    current_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    while current_date <= end_date:
-        instances = generate_chore_instances(
-            session=session,
-            user_id=user_id,
-            target_date=current_date
+    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # Evaluate the recurrence rules for every day of the range in one
+    # INSERT ... SELECT over generate_series
+    days = func.generate_series(
+        literal(start_date), literal(end_date), literal_column("interval '1 day'")
+    ).table_valued("value").render_derived()
+    chore_days = (
+        select(
+            Chore.id.label("chore_id"), Chore.user_id, days.c.value.label("date")
         )
-        all_created_instances.extend(instances)
-        current_date += timedelta(days=1)
-    
-    return all_created_instances
+        .select_from(Chore)
+        .join(days, true())
+        .where(
+            Chore.user_id == user_id,
+            Chore.is_active == True,
+            chore_is_due(cast(days.c.value, Date)),
+        )
+    )
+    statement = _insert_chore_logs(chore_days).returning(
+        *ChoreLog.__table__.columns  # type: ignore[attr-defined]
+    )
+    created_instances = session.scalars(
+        select(ChoreLog).from_statement(statement)
+    ).all()
+
+    # Chores whose next due day falls in the range are now scheduled after it
+    next_day = end_date + timedelta(days=1)
+    session.exec(  # type: ignore
+        update(Chore)
+        .where(
+            Chore.user_id == user_id,
+            Chore.is_active == True,
+            Chore.next_due_at < next_day,
+        )
+        .values(next_due_at=chore_next_due(next_day.date()))
+    )
+
+    return _commit_created_logs(
+        session=session, user_id=user_id, created_instances=created_instances
+    )
+
+
+def get_time_summary(
+    *,
+    session: Session,
+    user_id: uuid.UUID,
+    start: date,
+    end: date,
+    period: SummaryPeriod,
+) -> dict[str, Any]:
+    """
+    Summarize time logged per project and goal for the days [start, end].
+
+    Limits are the daily allocation for a day, the weekly allocation for a
+    week and the daily allocation times the number of days otherwise.
+    Limits, remaining time and over-limit flags are computed in the same
+    grouped query as the totals: its grouping sets return a row per
+    (project, goal) plus a subtotal row per project.
+    """
+    days = (end - start).days + 1
+
+    def limit_for(daily: Any, weekly: Any) -> Any:
+        if period == SummaryPeriod.DAY:
+            return daily
+        if period == SummaryPeriod.WEEK:
+            return weekly
+        return daily * days
+
+    project_columns = (
+        Project.id,
+        Project.name,
+        Project.color,
+        Project.daily_time_allocated_minutes,
+        Project.weekly_time_allocated_minutes,
+        Project.created_at,
+    )
+    goal_columns = (
+        Goal.id,
+        Goal.name,
+        Goal.daily_time_allocated_minutes,
+        Goal.weekly_time_allocated_minutes,
+        Goal.created_at,
+    )
+    is_project_total = func.grouping(Goal.id)
+    time_logged = func.coalesce(func.sum(Task.actual_time_minutes), 0)
+    limit = case(
+        (
+            is_project_total == 1,
+            limit_for(
+                Project.daily_time_allocated_minutes,
+                Project.weekly_time_allocated_minutes,
+            ),
+        ),
+        # An unset or zero goal allocation means the goal has no limit
+        else_=limit_for(
+            func.nullif(Goal.daily_time_allocated_minutes, 0),
+            func.nullif(Goal.weekly_time_allocated_minutes, 0),
+        ),
+    )
+
+    rows = session.exec(
+        select(
+            Project.id.label("project_id"),
+            Project.name.label("project_name"),
+            Project.color.label("project_color"),
+            Goal.id.label("goal_id"),
+            Goal.name.label("goal_name"),
+            is_project_total.label("is_project_total"),
+            limit.label("limit"),
+            time_logged.label("time_logged"),
+            (limit - time_logged).label("remaining"),
+            func.coalesce(time_logged > limit, False).label("is_over_limit"),
+        )
+        .select_from(Project)
+        .outerjoin(Goal)
+        .outerjoin(
+            Task,
+            (Task.goal_id == Goal.id)
+            & (Task.day >= start)
+            & (Task.day <= end),
+        )
+        .where(Project.user_id == user_id)
+        .group_by(
+            func.grouping_sets(
+                tuple_(*project_columns, *goal_columns), tuple_(*project_columns)
+            )
+        )
+        .order_by(
+            Project.created_at, Project.id, is_project_total.desc(), Goal.created_at
+        )
+    ).all()
+
+    def summarize(row: Any) -> dict[str, Any]:
+        return {
+            "limit": row.limit,
+            "time_logged": row.time_logged,
+            "remaining": row.remaining,
+            "percentage": (row.time_logged / row.limit * 100) if row.limit else 0,
+            "is_over_limit": row.is_over_limit,
+        }
+
+    projects: dict[uuid.UUID, dict[str, Any]] = {}
+    for row in rows:
+        if row.is_project_total:
+            projects[row.project_id] = {
+                "project_id": row.project_id,
+                "project_name": row.project_name,
+                "project_color": row.project_color,
+                **summarize(row),
+                "goals": [],
+            }
+        elif row.goal_id is not None:
+            projects[row.project_id]["goals"].append({
+                "goal_id": row.goal_id,
+                "goal_name": row.goal_name,
+                **summarize(row),
+            })
+
+    summary = list(projects.values())
+    return {
+        "period": period,
+        "start": start,
+        "end": end,
+        "days": days,
+        "projects": summary,
+        "total_time_logged": sum(p["time_logged"] for p in summary),
+        "total_limit": sum(p["limit"] for p in summary),
+    }
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from sqlmodel import Session, select
 
 from app.core.db import engine, init_db
+from app.crud import rebuild_user_day_stats, reschedule_chores
 from app.core.security import get_password_hash
 from app.models import (
     User, Project, Goal, Task, Chore, ChoreLog,
@@ -87,7 +88,8 @@ def create_sample_data(session: Session) -> None:
         deadline=datetime.utcnow() + timedelta(days=30),
         daily_time_allocated_minutes=360,  # 6 hours
         weekly_time_allocated_minutes=1800,  # 30 hours
-        project_id=work_project.id
+        project_id=work_project.id,
+        user_id=demo_user.id
     )
     
     bug_fixes_goal = Goal(
@@ -95,7 +97,8 @@ def create_sample_data(session: Session) -> None:
         description="Address technical debt and fix reported issues",
         daily_time_allocated_minutes=120,  # 2 hours
         weekly_time_allocated_minutes=600,  # 10 hours
-        project_id=work_project.id
+        project_id=work_project.id,
+        user_id=demo_user.id
     )
     
     # Personal goals
@@ -105,7 +108,8 @@ def create_sample_data(session: Session) -> None:
         deadline=datetime.utcnow() + timedelta(days=60),
         daily_time_allocated_minutes=90,  # 1.5 hours
         weekly_time_allocated_minutes=450,  # 7.5 hours
-        project_id=personal_project.id
+        project_id=personal_project.id,
+        user_id=demo_user.id
     )
     
     side_project_goal = Goal(
@@ -113,7 +117,8 @@ def create_sample_data(session: Session) -> None:
         description="Create a personal finance tracking app",
         daily_time_allocated_minutes=30,  # 30 minutes
         weekly_time_allocated_minutes=150,  # 2.5 hours
-        project_id=personal_project.id
+        project_id=personal_project.id,
+        user_id=demo_user.id
     )
     
     # Fitness goals
@@ -122,7 +127,8 @@ def create_sample_data(session: Session) -> None:
         description="Maintain consistent exercise schedule",
         daily_time_allocated_minutes=45,  # 45 minutes
         weekly_time_allocated_minutes=225,  # 3.75 hours
-        project_id=fitness_project.id
+        project_id=fitness_project.id,
+        user_id=demo_user.id
     )
     
     nutrition_goal = Goal(
@@ -130,7 +136,8 @@ def create_sample_data(session: Session) -> None:
         description="Plan and prep healthy meals",
         daily_time_allocated_minutes=15,  # 15 minutes
         weekly_time_allocated_minutes=75,  # 1.25 hours
-        project_id=fitness_project.id
+        project_id=fitness_project.id,
+        user_id=demo_user.id
     )
     
     session.add_all([
@@ -159,7 +166,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=180,
             actual_time_minutes=195,
             date=two_days_ago,
-            goal_id=feature_goal.id
+            goal_id=feature_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Implement dashboard API endpoints",
@@ -168,7 +176,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=240,
             actual_time_minutes=220,
             date=yesterday,
-            goal_id=feature_goal.id
+            goal_id=feature_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Build dashboard frontend components",
@@ -177,7 +186,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=300,
             actual_time_minutes=0,
             date=today,
-            goal_id=feature_goal.id
+            goal_id=feature_goal.id,
+            user_id=demo_user.id
         ),
         
         # Bug fixes tasks
@@ -188,7 +198,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=60,
             actual_time_minutes=75,
             date=yesterday,
-            goal_id=bug_fixes_goal.id
+            goal_id=bug_fixes_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Optimize database queries",
@@ -197,7 +208,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=120,
             actual_time_minutes=0,
             date=today,
-            goal_id=bug_fixes_goal.id
+            goal_id=bug_fixes_goal.id,
+            user_id=demo_user.id
         ),
         
         # Learning tasks
@@ -208,7 +220,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=90,
             actual_time_minutes=85,
             date=yesterday,
-            goal_id=learning_goal.id
+            goal_id=learning_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Build first React Native app",
@@ -217,7 +230,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=120,
             actual_time_minutes=0,
             date=today,
-            goal_id=learning_goal.id
+            goal_id=learning_goal.id,
+            user_id=demo_user.id
         ),
         
         # Side project tasks
@@ -228,7 +242,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=45,
             actual_time_minutes=50,
             date=two_days_ago,
-            goal_id=side_project_goal.id
+            goal_id=side_project_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Set up project repository",
@@ -237,7 +252,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=30,
             actual_time_minutes=0,
             date=today,
-            goal_id=side_project_goal.id
+            goal_id=side_project_goal.id,
+            user_id=demo_user.id
         ),
         
         # Workout tasks
@@ -248,7 +264,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=30,
             actual_time_minutes=35,
             date=yesterday,
-            goal_id=workout_goal.id
+            goal_id=workout_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Strength training",
@@ -257,7 +274,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=45,
             actual_time_minutes=0,
             date=today,
-            goal_id=workout_goal.id
+            goal_id=workout_goal.id,
+            user_id=demo_user.id
         ),
         
         # Nutrition tasks
@@ -268,7 +286,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=20,
             actual_time_minutes=25,
             date=two_days_ago,
-            goal_id=nutrition_goal.id
+            goal_id=nutrition_goal.id,
+            user_id=demo_user.id
         ),
         Task(
             name="Grocery shopping",
@@ -277,7 +296,8 @@ def create_sample_data(session: Session) -> None:
             estimated_time_minutes=45,
             actual_time_minutes=0,
             date=today,
-            goal_id=nutrition_goal.id
+            goal_id=nutrition_goal.id,
+            user_id=demo_user.id
         ),
     ]
     
@@ -331,6 +351,9 @@ def create_sample_data(session: Session) -> None:
     ]
     
     session.add_all(chores)
+    reschedule_chores(
+        session=session, chore_ids=[chore.id for chore in chores], from_date=today.date()
+    )
     session.commit()
     
     # Create sample chore logs
@@ -351,11 +374,14 @@ def create_sample_data(session: Session) -> None:
             if should_create_log:
                 chore_log = ChoreLog(
                     chore_id=chore.id,
+                    user_id=chore.user_id,
                     date=log_date,
                     actual_time_minutes=chore.estimated_time_minutes + (-5 if days_back % 2 else 5)  # Slight variation
                 )
                 session.add(chore_log)
     
+    # Sample rows are inserted directly, so backfill the dashboard rollup
+    rebuild_user_day_stats(session=session, user_id=demo_user.id)
     session.commit()
     logger.info("Sample data created successfully!")
 
@@ -1,8 +1,10 @@
 import uuid
+from typing import Annotated
 
 from pydantic import EmailStr
+from sqlalchemy import ARRAY, Column, Computed, Date, Index, Integer, text
 from sqlmodel import Field, Relationship, SQLModel
-from datetime import datetime
+from datetime import date, datetime
 
 
 # Shared properties
@@ -42,10 +44,14 @@ class UpdatePassword(SQLModel):
 
 # Database model, database table inferred from class name
 class User(UserBase, table=True):
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     hashed_password: str
     items: list["Item"] = Relationship(back_populates="owner", cascade_delete=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Bumped by every commit that writes the user's DailyOS data
+    data_version: int = Field(default=0)
     
     # DailyOS relationships
     projects: list["Project"] = Relationship(back_populates="user", cascade_delete=True)
@@ -59,7 +65,10 @@ class UserPublic(UserBase):
 
 class UsersPublic(SQLModel):
     data: list[UserPublic]
-    count: int
+    # None when the list was requested with include_count=none
+    count: int | None
+    # Cursor of the next page, None on the last one
+    next_cursor: str | None = None
 
 
 # Shared properties
@@ -133,6 +142,27 @@ class ChoreFrequency(str, Enum):
     WEEKLY = "weekly"
     MONTHLY = "monthly"
 
+# Enums for dashboard time series queries
+class TimeGranularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+class TimeSeriesGroupBy(str, Enum):
+    PROJECT = "project"
+    GOAL = "goal"
+
+class SummaryPeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    CUSTOM = "custom"
+
+class CountMode(str, Enum):
+    NONE = "none"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
 # Project Model
 class ProjectBase(SQLModel):
     name: str = Field(max_length=255)
@@ -150,6 +180,10 @@ class ProjectUpdate(ProjectBase):
     weekly_time_allocated_minutes: int | None = Field(default=None, ge=0)
 
 class Project(ProjectBase, table=True):
+    __table_args__ = (
+        Index("ix_project_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -164,7 +198,10 @@ class ProjectPublic(ProjectBase):
 
 class ProjectsPublic(SQLModel):
     data: list[ProjectPublic]
-    count: int
+    # None when the list was requested with include_count=none
+    count: int | None
+    # Cursor of the next page, None on the last one
+    next_cursor: str | None = None
 
 # Goal Model
 class GoalBase(SQLModel):
@@ -182,8 +219,14 @@ class GoalUpdate(GoalBase):
     project_id: uuid.UUID | None = Field(default=None)
 
 class Goal(GoalBase, table=True):
+    __table_args__ = (
+        Index("ix_goal_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     project_id: uuid.UUID = Field(foreign_key="project.id", nullable=False, ondelete="CASCADE")
+    # Copy of the project's user_id, so per-user queries don't join project
+    user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationships
@@ -197,7 +240,10 @@ class GoalPublic(GoalBase):
 
 class GoalsPublic(SQLModel):
     data: list[GoalPublic]
-    count: int
+    # None when the list was requested with include_count=none
+    count: int | None
+    # Cursor of the next page, None on the last one
+    next_cursor: str | None = None
 
 # Task Model
 class TaskBase(SQLModel):
@@ -219,9 +265,23 @@ class TaskUpdate(TaskBase):
     actual_time_minutes: int | None = Field(default=None, ge=0)
 
 class Task(TaskBase, table=True):
+    __table_args__ = (
+        Index("ix_task_goal_id_day", "goal_id", "day"),
+        Index("ix_task_user_id_day", "user_id", "day"),
+        Index(
+            "ix_task_user_id_date_created_at_id", "user_id", "date", "created_at", "id"
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     goal_id: uuid.UUID = Field(foreign_key="goal.id", nullable=False, ondelete="CASCADE")
+    # Copy of the goal's user_id, so per-user queries don't join goal and project
+    user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Calendar day of `date`, generated by the database for indexed day filters
+    day: date | None = Field(
+        default=None, sa_column=Column(Date, Computed("CAST(date AS DATE)", persisted=True))
+    )
 
     # Relationships
     goal: "Goal" = Relationship(back_populates="tasks")
@@ -233,14 +293,41 @@ class TaskPublic(TaskBase):
 
 class TasksPublic(SQLModel):
     data: list[TaskPublic]
-    count: int
+    # None when the list was requested with include_count=none
+    count: int | None
+    # Cursor of the next page, None on the last one
+    next_cursor: str | None = None
+
+class TaskBulkUpdate(TaskUpdate):
+    id: uuid.UUID
+
+class TaskBulkResult(SQLModel):
+    # Position of the item in the request
+    index: int
+    # What the single-task endpoint would have responded with
+    status_code: int
+    detail: str | None = None
+    task: TaskPublic | None = None
+
+class TaskBulkResults(SQLModel):
+    data: list[TaskBulkResult]
 
 # Chore Model
+Weekday = Annotated[int, Field(ge=0, le=6)]  # 0 is Monday
+
 class ChoreBase(SQLModel):
     name: str = Field(max_length=255)
     frequency: ChoreFrequency
     estimated_time_minutes: int = Field(ge=0)
     is_active: bool = Field(default=True)
+    # Recurrence: daily chores are due every interval_days days (counted from
+    # the day they were created), weekly chores on each of weekdays and
+    # monthly chores on month_day (or the month's last day if it's shorter)
+    interval_days: int = Field(default=1, ge=1, le=365)
+    weekdays: list[Weekday] = Field(
+        default_factory=lambda: [0], min_length=1, sa_type=ARRAY(Integer)
+    )
+    month_day: int = Field(default=1, ge=1, le=31)
 
 class ChoreCreate(ChoreBase):
     pass
@@ -250,11 +337,22 @@ class ChoreUpdate(ChoreBase):
     frequency: ChoreFrequency | None = Field(default=None)
     estimated_time_minutes: int | None = Field(default=None, ge=0)
     is_active: bool | None = Field(default=None)
+    interval_days: int | None = Field(default=None, ge=1, le=365)
+    weekdays: list[Weekday] | None = Field(default=None, min_length=1)
+    month_day: int | None = Field(default=None, ge=1, le=31)
 
 class Chore(ChoreBase, table=True):
+    __table_args__ = (
+        Index("ix_chore_user_id_next_due_at", "user_id", "next_due_at"),
+        Index("ix_chore_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Start of the next day an instance is due, kept up to date by
+    # crud.reschedule_chores and chore instance generation
+    next_due_at: datetime | None = Field(default=None)
 
     # Relationships
     user: "User" = Relationship(back_populates="chores")
@@ -263,10 +361,14 @@ class Chore(ChoreBase, table=True):
 class ChorePublic(ChoreBase):
     id: uuid.UUID
     created_at: datetime
+    next_due_at: datetime | None
 
 class ChoresPublic(SQLModel):
     data: list[ChorePublic]
-    count: int
+    # None when the list was requested with include_count=none
+    count: int | None
+    # Cursor of the next page, None on the last one
+    next_cursor: str | None = None
 
 # ChoreLog Model
 class ChoreLogBase(SQLModel):
@@ -280,9 +382,36 @@ class ChoreLogUpdate(ChoreLogBase):
     actual_time_minutes: int | None = Field(default=None, ge=0)
 
 class ChoreLog(ChoreLogBase, table=True):
+    # At most one log per chore and day, so concurrent generation can't
+    # create duplicates
+    __table_args__ = (
+        Index("uq_chorelog_chore_id_day", "chore_id", "day", unique=True),
+        # Only pending (not yet completed) logs, for the pending instances list
+        Index(
+            "ix_chorelog_pending_chore_id_day",
+            "chore_id",
+            "day",
+            postgresql_where=text("actual_time_minutes = 0"),
+        ),
+        Index("ix_chorelog_user_id_day", "user_id", "day"),
+        Index(
+            "ix_chorelog_user_id_date_created_at_id",
+            "user_id",
+            "date",
+            "created_at",
+            "id",
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     chore_id: uuid.UUID = Field(foreign_key="chore.id", nullable=False, ondelete="CASCADE")
+    # Copy of the chore's user_id, so per-user queries don't join chore
+    user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Calendar day of `date`, generated by the database for indexed day filters
+    day: date | None = Field(
+        default=None, sa_column=Column(Date, Computed("CAST(date AS DATE)", persisted=True))
+    )
 
     # Relationships
     chore: "Chore" = Relationship(back_populates="chore_logs")
@@ -294,4 +423,26 @@ class ChoreLogPublic(ChoreLogBase):
 
 class ChoreLogsPublic(SQLModel):
     data: list[ChoreLogPublic]
-    count: int
+    # None when the list was requested with include_count=none
+    count: int | None
+    # Cursor of the next page, None on the last one
+    next_cursor: str | None = None
+
+class ChoreInstanceCompletion(SQLModel):
+    instance_id: uuid.UUID
+    actual_time_minutes: int = Field(gt=0)
+
+# Per-user daily rollup of task and chore log activity. Rows are kept current
+# by the task and chore log write paths so dashboards read O(days) rows
+class UserDayStats(SQLModel, table=True):
+    __tablename__ = "user_day_stats"
+
+    user_id: uuid.UUID = Field(
+        foreign_key="user.id", primary_key=True, ondelete="CASCADE"
+    )
+    day: date = Field(primary_key=True)
+    tasks_total: int = Field(default=0)
+    tasks_done: int = Field(default=0)
+    task_minutes: int = Field(default=0)
+    chore_count: int = Field(default=0)
+    chore_minutes: int = Field(default=0)
@@ -0,0 +1,35 @@
+import argparse
+import logging
+import uuid
+
+from sqlmodel import Session
+
+from app import crud
+from app.core.db import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild(user_id: uuid.UUID | None = None) -> None:
+    with Session(engine) as session:
+        crud.rebuild_user_day_stats(session=session, user_id=user_id)
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Backfill the user_day_stats rollup from tasks and chore logs."
+    )
+    parser.add_argument(
+        "--user-id", type=uuid.UUID, help="Only rebuild rows for this user"
+    )
+    args = parser.parse_args()
+
+    logger.info("Rebuilding user day stats")
+    rebuild(args.user_id)
+    logger.info("User day stats rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.tests.utils.dailyos import create_random_chore
+
+
+def test_chore_analytics(
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+) -> None:
+    me = client.get(
+        f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers
+    ).json()
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    chore = create_random_chore(
+        db, uuid.UUID(me["id"]), created_at=today - timedelta(days=9)
+    )
+    # Done on each of the last 9 days except 4 days ago, not done yet today
+    for days_ago in [9, 8, 7, 6, 5, 3, 2, 1]:
+        r = client.post(
+            f"{settings.API_V1_STR}/chore-logs/",
+            headers=normal_user_token_headers,
+            json={
+                "chore_id": str(chore.id),
+                "date": (today - timedelta(days=days_ago)).isoformat(),
+                "actual_time_minutes": 10,
+            },
+        )
+        assert r.status_code == 200
+
+    r = client.get(
+        f"{settings.API_V1_STR}/chores/analytics",
+        headers=normal_user_token_headers,
+        params={"days": 30},
+    )
+    assert r.status_code == 200
+    analytics = next(c for c in r.json()["chores"] if c["chore_id"] == str(chore.id))
+    assert analytics["due"] == 9
+    assert analytics["completed"] == 8
+    assert analytics["completion_rate"] == 88.9
+    assert analytics["average_actual_minutes"] == 10
+    assert analytics["actual_vs_estimated"] == 0.67
+    assert analytics["current_streak"] == 3
+
+
+def test_read_pending_instances(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    chore = client.post(
+        f"{settings.API_V1_STR}/chores/",
+        headers=normal_user_token_headers,
+        json={"name": "Plants", "frequency": "daily", "estimated_time_minutes": 5},
+    ).json()
+    url = f"{settings.API_V1_STR}/chores/pending-instances"
+
+    r = client.get(url, headers=normal_user_token_headers)
+    assert r.status_code == 200
+    instance = next(i for i in r.json()["data"] if i["chore_id"] == chore["id"])
+    assert instance["actual_time_minutes"] == 0
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/chores/instances/{instance['id']}/complete",
+        headers=normal_user_token_headers,
+        params={"actual_time_minutes": 5},
+    )
+    assert r.status_code == 200
+
+    r = client.get(url, headers=normal_user_token_headers)
+    assert r.status_code == 200
+    assert chore["id"] not in [i["chore_id"] for i in r.json()["data"]]
+
+
+def test_undoing_completion_makes_chore_pending_again(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    chore = client.post(
+        f"{settings.API_V1_STR}/chores/",
+        headers=normal_user_token_headers,
+        json={"name": "Bins", "frequency": "daily", "estimated_time_minutes": 5},
+    ).json()
+    pending_url = f"{settings.API_V1_STR}/chores/pending-instances"
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def pending_chore_ids() -> list[str]:
+        r = client.get(pending_url, headers=normal_user_token_headers)
+        return [instance["chore_id"] for instance in r.json()["data"]]
+
+    def complete_today() -> str:
+        r = client.post(
+            f"{settings.API_V1_STR}/chore-logs/",
+            headers=normal_user_token_headers,
+            json={
+                "chore_id": chore["id"],
+                "date": today.isoformat(),
+                "actual_time_minutes": 5,
+            },
+        )
+        assert r.status_code == 200
+        assert chore["id"] not in pending_chore_ids()
+        log_id: str = r.json()["id"]
+        return log_id
+
+    # Deleting today's log
+    log_id = complete_today()
+    r = client.delete(
+        f"{settings.API_V1_STR}/chore-logs/{log_id}", headers=normal_user_token_headers
+    )
+    assert r.status_code == 200
+    assert chore["id"] in pending_chore_ids()
+
+    # Moving today's log to another day
+    log_id = complete_today()
+    r = client.put(
+        f"{settings.API_V1_STR}/chore-logs/{log_id}",
+        headers=normal_user_token_headers,
+        json={"date": (today - timedelta(days=1)).isoformat()},
+    )
+    assert r.status_code == 200
+    assert chore["id"] in pending_chore_ids()
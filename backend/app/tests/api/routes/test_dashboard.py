@@ -0,0 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.db import engine
+
+
+def test_dashboard_summary(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    before = client.get(
+        f"{settings.API_V1_STR}/dashboard/summary", headers=normal_user_token_headers
+    ).json()
+
+    project = client.post(
+        f"{settings.API_V1_STR}/projects/",
+        headers=normal_user_token_headers,
+        json={
+            "name": "Summary",
+            "daily_time_allocated_minutes": 60,
+            "weekly_time_allocated_minutes": 300,
+        },
+    ).json()
+    goal = client.post(
+        f"{settings.API_V1_STR}/goals/",
+        headers=normal_user_token_headers,
+        json={"name": "Summary goal", "project_id": project["id"]},
+    ).json()
+    client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=normal_user_token_headers,
+        json={
+            "name": "Summary task",
+            "goal_id": goal["id"],
+            "status": "done",
+            "actual_time_minutes": 25,
+        },
+    )
+
+    r = client.get(
+        f"{settings.API_V1_STR}/dashboard/summary", headers=normal_user_token_headers
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert set(content) == {"projects", "goals", "tasks", "time", "chores", "period"}
+    assert content["projects"]["total"] == before["projects"]["total"] + 1
+    assert content["goals"]["total"] == before["goals"]["total"] + 1
+    assert content["tasks"]["total"] == before["tasks"]["total"] + 1
+    assert content["tasks"]["completed"] == before["tasks"]["completed"] + 1
+    assert (
+        content["tasks"]["this_week"]["total"]
+        == before["tasks"]["this_week"]["total"] + 1
+    )
+    assert (
+        content["time"]["total_logged_minutes"]
+        == before["time"]["total_logged_minutes"] + 25
+    )
+    assert (
+        content["time"]["weekly_allocated_minutes"]
+        == before["time"]["weekly_allocated_minutes"] + 300
+    )
+
+
+def test_dashboard_summary_statement_count(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    # Count the queries of a cache miss, not of a response cached earlier
+    response_cache.clear()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        r = client.get(
+            f"{settings.API_V1_STR}/dashboard/summary",
+            headers=normal_user_token_headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert r.status_code == 200
+    # One statement to load the current user, one for the whole summary
+    assert len(statements) <= 2
+
+
+def test_dashboard_summary_cache_invalidated_on_commit(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/dashboard/summary"
+    first = client.get(url, headers=normal_user_token_headers).json()
+    hits = response_cache.hits
+
+    cached = client.get(url, headers=normal_user_token_headers).json()
+    assert response_cache.hits == hits + 1
+    assert cached == first
+
+    client.post(
+        f"{settings.API_V1_STR}/projects/",
+        headers=normal_user_token_headers,
+        json={
+            "name": "Cache",
+            "daily_time_allocated_minutes": 30,
+            "weekly_time_allocated_minutes": 120,
+        },
+    )
+    refreshed = client.get(url, headers=normal_user_token_headers).json()
+    assert refreshed["projects"]["total"] == first["projects"]["total"] + 1
+
+
+def test_time_series(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    project = client.post(
+        f"{settings.API_V1_STR}/projects/",
+        headers=normal_user_token_headers,
+        json={
+            "name": "Series",
+            "daily_time_allocated_minutes": 60,
+            "weekly_time_allocated_minutes": 300,
+        },
+    ).json()
+    goal = client.post(
+        f"{settings.API_V1_STR}/goals/",
+        headers=normal_user_token_headers,
+        json={"name": "Series goal", "project_id": project["id"]},
+    ).json()
+    for day, minutes in [("2025-01-06", 30), ("2025-01-08", 15), ("2025-01-20", 40)]:
+        client.post(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=normal_user_token_headers,
+            json={
+                "name": "Series task",
+                "goal_id": goal["id"],
+                "date": f"{day}T10:00:00",
+                "actual_time_minutes": minutes,
+            },
+        )
+
+    r = client.get(
+        f"{settings.API_V1_STR}/dashboard/time-series",
+        headers=normal_user_token_headers,
+        params={"from": "2025-01-01", "to": "2025-01-31", "granularity": "week"},
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert content["buckets"] == [
+        "2024-12-30",
+        "2025-01-06",
+        "2025-01-13",
+        "2025-01-20",
+        "2025-01-27",
+    ]
+    series = next(s for s in content["series"] if s["id"] == project["id"])
+    assert series["values"] == [0, 45, 0, 40, 0]
+    assert series["total"] == 85
+
+    r = client.get(
+        f"{settings.API_V1_STR}/dashboard/time-series",
+        headers=normal_user_token_headers,
+        params={"from": "2000-01-01", "to": "2025-01-31"},
+    )
+    assert r.status_code == 400
+    r = client.get(
+        f"{settings.API_V1_STR}/dashboard/time-series",
+        headers=normal_user_token_headers,
+        params={"from": "9999-12-01", "to": "9999-12-31", "granularity": "month"},
+    )
+    assert r.status_code == 200
+    assert r.json()["buckets"] == ["9999-12-01"]
+
+
+def test_dashboard_bundle(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/dashboard/bundle", headers=normal_user_token_headers
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert set(content) == {
+        "summary",
+        "time_by_project",
+        "daily_time_summary",
+        "pending_chores",
+    }
+    summary = client.get(
+        f"{settings.API_V1_STR}/dashboard/summary", headers=normal_user_token_headers
+    ).json()
+    assert content["summary"] == summary
+    timing = r.headers["Server-Timing"]
+    for name in ["summary", "time-by-project", "daily-time-summary", "pending-chores"]:
+        assert f"{name};dur=" in timing
+
+
+def test_dashboard_bundle_concurrent_requests(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    # More bundles in flight than the pool has connections, including overflow
+    requests = settings.POSTGRES_POOL_SIZE + settings.POSTGRES_MAX_OVERFLOW + 5
+
+    def get_bundle(_: int) -> int:
+        response_cache.clear()
+        r = client.get(
+            f"{settings.API_V1_STR}/dashboard/bundle",
+            headers=normal_user_token_headers,
+        )
+        return r.status_code
+
+    with ThreadPoolExecutor(max_workers=requests) as executor:
+        status_codes = list(executor.map(get_bundle, range(requests)))
+    assert status_codes == [200] * requests
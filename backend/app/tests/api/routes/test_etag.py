@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlmodel import Session, col
+
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.models import User
+
+
+def test_read_tasks_not_modified(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/tasks/"
+    r = client.get(url, headers=normal_user_token_headers)
+    assert r.status_code == 200
+    etag = r.headers["ETag"]
+
+    r = client.get(url, headers={**normal_user_token_headers, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.headers["ETag"] == etag
+    assert r.content == b""
+
+
+def test_write_changes_etag(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/dashboard/summary"
+    etag = client.get(url, headers=normal_user_token_headers).headers["ETag"]
+
+    client.post(
+        f"{settings.API_V1_STR}/chores/",
+        headers=normal_user_token_headers,
+        json={"name": "Dishes", "frequency": "daily", "estimated_time_minutes": 10},
+    )
+
+    r = client.get(url, headers={**normal_user_token_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+
+
+def test_cache_follows_data_version(
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+) -> None:
+    url = f"{settings.API_V1_STR}/dashboard/summary"
+    client.get(url, headers=normal_user_token_headers)
+    misses = response_cache.misses
+
+    # A write committed by another worker bumps the version without
+    # invalidating this worker's cache
+    db.exec(  # type: ignore
+        update(User)
+        .where(col(User.email) == settings.EMAIL_TEST_USER)
+        .values(data_version=User.data_version + 1)
+    )
+    db.commit()
+
+    r = client.get(url, headers=normal_user_token_headers)
+    assert r.status_code == 200
+    assert response_cache.misses == misses + 1
@@ -0,0 +1,213 @@
+import uuid
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.db import engine
+
+
+def create_task(client: TestClient, headers: dict[str, str]) -> dict[str, Any]:
+    project = client.post(
+        f"{settings.API_V1_STR}/projects/",
+        headers=headers,
+        json={
+            "name": "Tasks",
+            "daily_time_allocated_minutes": 60,
+            "weekly_time_allocated_minutes": 300,
+        },
+    ).json()
+    goal = client.post(
+        f"{settings.API_V1_STR}/goals/",
+        headers=headers,
+        json={"name": "Tasks goal", "project_id": project["id"]},
+    ).json()
+    task: dict[str, Any] = client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=headers,
+        json={"name": "Task", "goal_id": goal["id"], "actual_time_minutes": 5},
+    ).json()
+    return task
+
+
+def test_log_time_to_task(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> None:
+    task = create_task(client, normal_user_token_headers)
+    url = f"{settings.API_V1_STR}/tasks/{task['id']}/log-time"
+
+    for minutes in [10, 15]:
+        r = client.patch(
+            url, headers=normal_user_token_headers, params={"minutes": minutes}
+        )
+        assert r.status_code == 200
+    assert r.json()["actual_time_minutes"] == 30
+    assert r.json()["id"] == task["id"]
+
+    r = client.patch(url, headers=superuser_token_headers, params={"minutes": 10})
+    assert r.status_code == 403
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/tasks/{uuid.uuid4()}/log-time",
+        headers=normal_user_token_headers,
+        params={"minutes": 10},
+    )
+    assert r.status_code == 404
+
+    r = client.get(
+        f"{settings.API_V1_STR}/tasks/{task['id']}", headers=normal_user_token_headers
+    )
+    assert r.json()["actual_time_minutes"] == 30
+
+
+def test_read_task_ownership(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> None:
+    task = create_task(client, normal_user_token_headers)
+    url = f"{settings.API_V1_STR}/tasks/{task['id']}"
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        r = client.get(url, headers=normal_user_token_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert r.status_code == 200
+    assert r.json() == task
+    # One statement to load the current user, one for the task and its owner
+    assert len(statements) <= 2
+
+    r = client.get(url, headers=superuser_token_headers)
+    assert r.status_code == 403
+    r = client.delete(url, headers=superuser_token_headers)
+    assert r.status_code == 403
+    r = client.get(
+        f"{settings.API_V1_STR}/tasks/{uuid.uuid4()}", headers=normal_user_token_headers
+    )
+    assert r.status_code == 404
+
+
+def test_read_tasks_cursor_pagination(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    first = create_task(client, normal_user_token_headers)
+    for _ in range(2):
+        client.post(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=normal_user_token_headers,
+            json={"name": "Task", "goal_id": first["goal_id"]},
+        )
+    url = f"{settings.API_V1_STR}/tasks/"
+    params: dict[str, Any] = {"goal_id": first["goal_id"], "limit": 2}
+
+    page = client.get(url, headers=normal_user_token_headers, params=params).json()
+    assert len(page["data"]) == 2
+    assert page["next_cursor"]
+    last = client.get(
+        url,
+        headers=normal_user_token_headers,
+        params={**params, "cursor": page["next_cursor"]},
+    ).json()
+    assert len(last["data"]) == 1
+    assert last["next_cursor"] is None
+    ids = [task["id"] for task in page["data"] + last["data"]]
+    assert len(set(ids)) == 3
+
+    # Offset pagination still works without a cursor
+    skipped = client.get(
+        url, headers=normal_user_token_headers, params={**params, "skip": 2}
+    ).json()
+    assert [task["id"] for task in skipped["data"]] == ids[2:]
+
+    r = client.get(
+        url, headers=normal_user_token_headers, params={**params, "cursor": "nope"}
+    )
+    assert r.status_code == 400
+
+
+def test_read_tasks_include_count(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    task = create_task(client, normal_user_token_headers)
+    url = f"{settings.API_V1_STR}/tasks/"
+    params = {"goal_id": task["goal_id"]}
+
+    exact = client.get(url, headers=normal_user_token_headers, params=params).json()
+    assert exact["count"] == 1
+    none = client.get(
+        url,
+        headers=normal_user_token_headers,
+        params={**params, "include_count": "none"},
+    ).json()
+    assert none["count"] is None
+    assert none["data"] == exact["data"]
+    estimate = client.get(
+        url,
+        headers=normal_user_token_headers,
+        params={**params, "include_count": "estimate"},
+    ).json()
+    assert isinstance(estimate["count"], int)
+    assert estimate["count"] >= 0
+
+
+def test_bulk_tasks(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> None:
+    goal_id = create_task(client, normal_user_token_headers)["goal_id"]
+    other_goal_id = create_task(client, superuser_token_headers)["goal_id"]
+    url = f"{settings.API_V1_STR}/tasks/bulk"
+
+    r = client.post(
+        url,
+        headers=normal_user_token_headers,
+        json=[
+            {"name": "Monday", "goal_id": goal_id, "actual_time_minutes": 10},
+            {"name": "Someone else's", "goal_id": other_goal_id},
+            {"name": "Tuesday", "goal_id": goal_id},
+            {"name": "Nowhere", "goal_id": str(uuid.uuid4())},
+        ],
+    )
+    assert r.status_code == 200
+    created = r.json()["data"]
+    assert [item["status_code"] for item in created] == [200, 403, 200, 404]
+    ids = [created[0]["task"]["id"], created[2]["task"]["id"]]
+    for id in ids:
+        r = client.get(
+            f"{settings.API_V1_STR}/tasks/{id}", headers=normal_user_token_headers
+        )
+        assert r.status_code == 200
+
+    r = client.put(
+        url,
+        headers=normal_user_token_headers,
+        json=[
+            {"id": ids[0], "status": "done"},
+            {"id": ids[1], "goal_id": other_goal_id},
+        ],
+    )
+    updated = r.json()["data"]
+    assert [item["status_code"] for item in updated] == [200, 403]
+    assert updated[0]["task"]["status"] == "done"
+    assert updated[0]["task"]["actual_time_minutes"] == 10
+
+    r = client.request(
+        "DELETE", url, headers=normal_user_token_headers, json=[*ids, ids[0]]
+    )
+    assert r.status_code == 400
+    r = client.request("DELETE", url, headers=normal_user_token_headers, json=ids)
+    assert [item["status_code"] for item in r.json()["data"]] == [200, 200]
+    for id in ids:
+        r = client.get(
+            f"{settings.API_V1_STR}/tasks/{id}", headers=normal_user_token_headers
+        )
+        assert r.status_code == 404
@@ -0,0 +1,185 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.db import engine
+
+
+def _create_goal(client: TestClient, headers: dict[str, str]) -> dict[str, Any]:
+    project = client.post(
+        f"{settings.API_V1_STR}/projects/",
+        headers=headers,
+        json={
+            "name": "Tracking",
+            "daily_time_allocated_minutes": 120,
+            "weekly_time_allocated_minutes": 600,
+        },
+    ).json()
+    goal: dict[str, Any] = client.post(
+        f"{settings.API_V1_STR}/goals/",
+        headers=headers,
+        json={
+            "name": "Tracking goal",
+            "project_id": project["id"],
+            "daily_time_allocated_minutes": 60,
+            "weekly_time_allocated_minutes": 300,
+        },
+    ).json()
+    return goal
+
+
+def test_heatmap(client: TestClient, normal_user_token_headers: dict[str, str]) -> None:
+    goal = _create_goal(client, normal_user_token_headers)
+    for day, minutes in [("2023-01-02", 20), ("2023-01-03", 35), ("2023-01-05", 10)]:
+        client.post(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=normal_user_token_headers,
+            json={
+                "name": "Heatmap task",
+                "goal_id": goal["id"],
+                "date": f"{day}T08:00:00",
+                "actual_time_minutes": minutes,
+            },
+        )
+
+    r = client.get(
+        f"{settings.API_V1_STR}/time-tracking/heatmap",
+        headers=normal_user_token_headers,
+        params={"year": 2023},
+    )
+    assert r.status_code == 200
+    content = r.json()
+    assert content["days"] == 365
+    assert len(content["task_minutes"]) == 365
+    assert len(content["chore_minutes"]) == 365
+    assert content["task_minutes"][:5] == [0, 20, 35, 0, 10]
+    assert content["longest_streak"] == 2
+    assert content["current_streak"] == 0
+
+    r = client.get(
+        f"{settings.API_V1_STR}/time-tracking/heatmap",
+        headers=normal_user_token_headers,
+        params={"year": 9999},
+    )
+    assert r.status_code == 200
+    assert r.json()["days"] == 365
+
+
+def test_daily_summary(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    goal = _create_goal(client, normal_user_token_headers)
+    for minutes in [25, 50]:
+        client.post(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=normal_user_token_headers,
+            json={
+                "name": "Daily task",
+                "goal_id": goal["id"],
+                "date": "2023-03-14T09:30:00",
+                "actual_time_minutes": minutes,
+            },
+        )
+
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        r = client.get(
+            f"{settings.API_V1_STR}/time-tracking/daily-summary",
+            headers=normal_user_token_headers,
+            params={"target_date": "2023-03-14"},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert r.status_code == 200
+    assert len(statements) <= 2
+    content = r.json()
+    project = next(
+        p
+        for p in content["projects"]
+        if any(g["goal_id"] == goal["id"] for g in p["goals"])
+    )
+    assert project["time_logged"] == 75
+    assert project["daily_limit"] == 120
+    assert project["remaining"] == 45
+    assert project["is_over_limit"] is False
+    goal_summary = next(g for g in project["goals"] if g["goal_id"] == goal["id"])
+    assert goal_summary["time_logged"] == 75
+    assert goal_summary["remaining"] == -15
+    assert goal_summary["is_over_limit"] is True
+
+
+def test_summary_periods(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    goal = _create_goal(client, normal_user_token_headers)
+    for day, minutes in [("2024-02-05", 50), ("2024-02-07", 40), ("2024-02-20", 70)]:
+        client.post(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=normal_user_token_headers,
+            json={
+                "name": "Summary task",
+                "goal_id": goal["id"],
+                "date": f"{day}T09:00:00",
+                "actual_time_minutes": minutes,
+            },
+        )
+
+    def goal_summary(params: dict[str, str]) -> dict[str, Any]:
+        r = client.get(
+            f"{settings.API_V1_STR}/time-tracking/summary",
+            headers=normal_user_token_headers,
+            params=params,
+        )
+        assert r.status_code == 200
+        project = next(
+            p for p in r.json()["projects"] if p["project_id"] == goal["project_id"]
+        )
+        summary: dict[str, Any] = project["goals"][0]
+        return summary
+
+    week = goal_summary({"period": "week", "from": "2024-02-07"})
+    assert week["limit"] == 300
+    assert week["time_logged"] == 90
+    assert week["remaining"] == 210
+
+    month = goal_summary({"period": "month", "from": "2024-02-14"})
+    assert month["limit"] == 60 * 29
+    assert month["time_logged"] == 160
+
+    custom = goal_summary({"period": "custom", "from": "2024-02-06", "to": "2024-02-07"})
+    assert custom["limit"] == 120
+    assert custom["time_logged"] == 40
+    assert custom["is_over_limit"] is False
+
+    r = client.get(
+        f"{settings.API_V1_STR}/time-tracking/summary",
+        headers=normal_user_token_headers,
+        params={"period": "custom", "from": "2024-02-07"},
+    )
+    assert r.status_code == 400
+
+    for params in [
+        {"period": "week", "from": "9999-12-31"},
+        {"period": "custom", "from": "2000-01-01", "to": "2024-02-07"},
+    ]:
+        r = client.get(
+            f"{settings.API_V1_STR}/time-tracking/summary",
+            headers=normal_user_token_headers,
+            params=params,
+        )
+        assert r.status_code == 400
+    r = client.get(
+        f"{settings.API_V1_STR}/time-tracking/summary",
+        headers=normal_user_token_headers,
+        params={"period": "month", "from": "9999-12-31"},
+    )
+    assert r.status_code == 200
+    assert r.json()["end"] == "9999-12-31"
@@ -0,0 +1,251 @@
+from datetime import date, datetime
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import ChoreFrequency, ChoreLog, UserDayStats
+from app.tests.utils.dailyos import create_random_chore
+from app.tests.utils.user import create_random_user
+
+
+def test_generate_chore_instances_follows_frequency(db: Session) -> None:
+    user = create_random_user(db)
+    due_from = date(2025, 9, 1)
+    daily = create_random_chore(db, user.id, ChoreFrequency.DAILY, due_from=due_from)
+    weekly = create_random_chore(db, user.id, ChoreFrequency.WEEKLY, due_from=due_from)
+    monthly = create_random_chore(
+        db, user.id, ChoreFrequency.MONTHLY, due_from=due_from
+    )
+
+    # 2025-09-01 is a Monday and the 1st of the month
+    monday_first = crud.generate_chore_instances(
+        session=db, user_id=user.id, target_date=datetime(2025, 9, 1, 15, 30)
+    )
+    assert {log.chore_id for log in monday_first} == {
+        daily.id,
+        weekly.id,
+        monthly.id,
+    }
+    assert all(log.date == datetime(2025, 9, 1) for log in monday_first)
+    assert all(log.actual_time_minutes == 0 for log in monday_first)
+
+    tuesday = crud.generate_chore_instances(
+        session=db, user_id=user.id, target_date=datetime(2025, 9, 2)
+    )
+    assert [log.chore_id for log in tuesday] == [daily.id]
+
+
+def test_generate_chore_instances_skips_existing_logs(db: Session) -> None:
+    user = create_random_user(db)
+    chore = create_random_chore(db, user.id, due_from=date(2025, 9, 2))
+    db.add(
+        ChoreLog(
+            chore_id=chore.id,
+            user_id=user.id,
+            date=datetime(2025, 9, 2, 18),
+            actual_time_minutes=10,
+        )
+    )
+    db.commit()
+    assert (
+        crud.generate_chore_instances(
+            session=db, user_id=user.id, target_date=datetime(2025, 9, 2)
+        )
+        == []
+    )
+    target_date = datetime(2025, 9, 3)
+
+    first = crud.generate_chore_instances(
+        session=db, user_id=user.id, target_date=target_date
+    )
+    second = crud.generate_chore_instances(
+        session=db, user_id=user.id, target_date=target_date
+    )
+    assert len(first) == 1
+    assert second == []
+
+
+def test_generate_chore_instances_for_date_range(db: Session) -> None:
+    user = create_random_user(db)
+    due_from = date(2025, 9, 2)
+    daily = create_random_chore(db, user.id, ChoreFrequency.DAILY, due_from=due_from)
+    weekly = create_random_chore(db, user.id, ChoreFrequency.WEEKLY, due_from=due_from)
+    crud.generate_chore_instances(
+        session=db, user_id=user.id, target_date=datetime(2025, 9, 2)
+    )
+
+    created = crud.generate_chore_instances_for_date_range(
+        session=db,
+        user_id=user.id,
+        start_date=datetime(2025, 9, 1),
+        end_date=datetime(2025, 9, 14, 18),
+    )
+    # 13 daily logs (the 2nd already existed) and the two Mondays
+    assert len([log for log in created if log.chore_id == daily.id]) == 13
+    assert [log.date for log in created if log.chore_id == weekly.id] == [
+        datetime(2025, 9, 1),
+        datetime(2025, 9, 8),
+    ]
+
+
+def test_generate_chore_instances_for_users(db: Session) -> None:
+    users = [create_random_user(db) for _ in range(2)]
+    target_date = datetime(2025, 9, 10)
+    for user in users:
+        for frequency in [ChoreFrequency.DAILY, ChoreFrequency.MONTHLY]:
+            create_random_chore(db, user.id, frequency, due_from=target_date.date())
+
+    created = crud.generate_chore_instances_for_users(
+        session=db, user_ids=[user.id for user in users], target_date=target_date
+    )
+    assert created == 2
+    assert (
+        crud.generate_chore_instances_for_users(
+            session=db, user_ids=[user.id for user in users], target_date=target_date
+        )
+        == 0
+    )
+    for user in users:
+        stats = db.get(UserDayStats, (user.id, target_date.date()))
+        assert stats is not None
+        assert stats.chore_count == 1
+        assert stats.tasks_total == stats.tasks_done == 0
+        assert stats.task_minutes == stats.chore_minutes == 0
+
+
+def test_reschedule_chores_follows_recurrence_rules(db: Session) -> None:
+    user = create_random_user(db)
+    # 2025-02-05 is a Wednesday
+    due_from = date(2025, 2, 5)
+    every_third_day = create_random_chore(
+        db, user.id, ChoreFrequency.DAILY, interval_days=3
+    )
+    tuesday_and_friday = create_random_chore(
+        db, user.id, ChoreFrequency.WEEKLY, due_from=due_from, weekdays=[1, 4]
+    )
+    end_of_month = create_random_chore(
+        db, user.id, ChoreFrequency.MONTHLY, due_from=due_from, month_day=31
+    )
+
+    assert every_third_day.next_due_at == datetime.combine(
+        every_third_day.created_at.date(), datetime.min.time()
+    )
+    assert tuesday_and_friday.next_due_at == datetime(2025, 2, 7)
+    assert end_of_month.next_due_at == datetime(2025, 2, 28)
+
+    created = crud.generate_chore_instances(
+        session=db, user_id=user.id, target_date=datetime(2025, 2, 7)
+    )
+    assert [log.chore_id for log in created] == [tuesday_and_friday.id]
+    db.refresh(tuesday_and_friday)
+    assert tuesday_and_friday.next_due_at == datetime(2025, 2, 11)
+
+
+def test_pending_chore_instances_are_virtual_until_completed(db: Session) -> None:
+    user = create_random_user(db)
+    today = datetime(2025, 9, 15)
+    chore = create_random_chore(db, user.id, due_from=today.date())
+
+    pending = crud.get_pending_chore_instances(
+        session=db, user_id=user.id, target_date=today
+    )
+    assert len(pending) == 1
+    instance = pending[0]
+    assert instance.chore_id == chore.id
+    assert instance.id == crud.virtual_chore_instance_id(chore.id, today.date())
+    assert db.get(ChoreLog, instance.id) is None
+
+    completed = crud.complete_chore_instance(
+        session=db, chore_log=instance, actual_time_minutes=12
+    )
+    assert completed is not None
+    assert completed.id == instance.id
+    assert completed.actual_time_minutes == 12
+    assert db.get(ChoreLog, instance.id) is not None
+    assert (
+        crud.get_pending_chore_instances(
+            session=db, user_id=user.id, target_date=today
+        )
+        == []
+    )
+    db.refresh(chore)
+    assert chore.next_due_at == datetime(2025, 9, 16)
+    stats = db.get(UserDayStats, (user.id, today.date()))
+    assert stats is not None
+    assert (stats.chore_count, stats.chore_minutes) == (1, 12)
+
+
+def test_complete_chore_instances(db: Session) -> None:
+    user = create_random_user(db)
+    today = datetime(2025, 9, 16)
+    generated = create_random_chore(db, user.id, due_from=today.date())
+    virtual = create_random_chore(db, user.id, due_from=today.date())
+    chore_log = ChoreLog(
+        chore_id=generated.id, user_id=user.id, date=today, actual_time_minutes=0
+    )
+    db.add(chore_log)
+    crud.update_user_day_stats(
+        session=db, user_id=user.id, changes=[crud.chore_log_day_stats(chore_log)]
+    )
+    db.commit()
+
+    pending = crud.get_pending_chore_instances(
+        session=db, user_id=user.id, target_date=today
+    )
+    assert len(pending) == 2
+
+    completed = crud.complete_chore_instances(
+        session=db,
+        user_id=user.id,
+        completions=[(instance, 5 + index) for index, instance in enumerate(pending)],
+    )
+    assert completed is not None
+    assert sorted(log.id for log in completed) == sorted(log.id for log in pending)
+    assert sorted(log.actual_time_minutes for log in completed) == [5, 6]
+    assert (
+        crud.get_pending_chore_instances(
+            session=db, user_id=user.id, target_date=today
+        )
+        == []
+    )
+    for chore in [generated, virtual]:
+        db.refresh(chore)
+        assert chore.next_due_at == datetime(2025, 9, 17)
+    stats = db.get(UserDayStats, (user.id, today.date()))
+    assert stats is not None
+    assert (stats.chore_count, stats.chore_minutes) == (2, 11)
+
+
+def test_complete_virtual_instance_twice(db: Session) -> None:
+    user = create_random_user(db)
+    today = datetime(2025, 9, 18)
+    create_random_chore(db, user.id, due_from=today.date())
+    # Two requests that both found the instance still virtual
+    [first] = crud.get_pending_chore_instances(
+        session=db, user_id=user.id, target_date=today
+    )
+    [second] = crud.get_pending_chore_instances(
+        session=db, user_id=user.id, target_date=today
+    )
+
+    assert crud.complete_chore_instance(
+        session=db, chore_log=first, actual_time_minutes=7
+    )
+    assert (
+        crud.complete_chore_instance(
+            session=db, chore_log=second, actual_time_minutes=9
+        )
+        is None
+    )
+    assert (
+        crud.complete_chore_instances(
+            session=db, user_id=user.id, completions=[(second, 9)]
+        )
+        is None
+    )
+    chore_log = db.get(ChoreLog, first.id)
+    assert chore_log is not None
+    assert chore_log.actual_time_minutes == 7
+    stats = db.get(UserDayStats, (user.id, today.date()))
+    assert stats is not None
+    assert (stats.chore_count, stats.chore_minutes) == (1, 7)
@@ -0,0 +1,142 @@
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import literal_column, text
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, select
+
+from app.models import Chore, ChoreFrequency, ChoreLog, Goal, Project, Task
+from app.tests.utils.dailyos import (
+    build_task,
+    create_random_goal,
+    create_random_project,
+)
+from app.tests.utils.user import create_random_user
+
+
+def _explain(db: Session, statement: Any) -> str:
+    """
+    Return the plan for a statement with sequential scans disabled, so the
+    plan only uses an index if the predicates can actually use one.
+    """
+    compiled = statement.compile(dialect=postgresql.dialect())
+    connection = db.connection()
+    connection.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = connection.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params).all()
+    db.rollback()
+    return "\n".join(row[0] for row in plan)
+
+
+def _index_conditions(plan: str) -> str:
+    """
+    The plan's index conditions, i.e. the predicates that bound an index scan
+    rather than filter the rows it returns.
+    """
+    return "\n".join(line for line in plan.splitlines() if "Index Cond" in line)
+
+
+def _analyze(db: Session, table: str) -> None:
+    # Fresh statistics, so several indexes on user_id aren't a tie the planner
+    # may break either way
+    db.connection().execute(text(f"ANALYZE {table}"))
+    db.commit()
+
+
+def test_task_day_range_uses_index(db: Session) -> None:
+    user = create_random_user(db)
+    goal = create_random_goal(db, create_random_project(db, user.id).id)
+    today = date.today()
+
+    statement = (
+        select(Task.id)
+        .join(Goal)
+        .join(Project)
+        .where(
+            Project.user_id == user.id,
+            Task.goal_id == goal.id,
+            Task.day >= today - timedelta(days=6),
+            Task.day < today + timedelta(days=1),
+        )
+    )
+    assert "ix_task_goal_id_day" in _explain(db, statement)
+
+
+def test_user_task_day_range_uses_index(db: Session) -> None:
+    user = create_random_user(db)
+    goal = create_random_goal(db, create_random_project(db, user.id).id)
+    now = datetime.utcnow()
+    db.add_all(build_task(goal, date=now - timedelta(days=i)) for i in range(300))
+    db.commit()
+    _analyze(db, "task")
+    today = now.date()
+
+    statement = select(Task.id).where(
+        Task.user_id == user.id,
+        Task.day >= today - timedelta(days=6),
+        Task.day < today + timedelta(days=1),
+    )
+    # Any index will do, as long as the day range bounds the scan
+    conditions = _index_conditions(_explain(db, statement))
+    assert "user_id =" in conditions
+    assert "day >=" in conditions
+    assert "day <" in conditions
+
+
+def test_chore_log_day_uses_index(db: Session) -> None:
+    user = create_random_user(db)
+    chore = Chore(
+        name="Dishes",
+        frequency=ChoreFrequency.DAILY,
+        estimated_time_minutes=10,
+        user_id=user.id,
+    )
+    db.add(chore)
+    db.commit()
+
+    statement = select(ChoreLog.id).where(
+        ChoreLog.chore_id == chore.id, ChoreLog.day == date.today()
+    )
+    assert "uq_chorelog_chore_id_day" in _explain(db, statement)
+
+
+def test_due_chores_use_index(db: Session) -> None:
+    user = create_random_user(db)
+    tomorrow = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+    db.add_all(
+        Chore(
+            name="Chore",
+            frequency=ChoreFrequency.DAILY,
+            estimated_time_minutes=10,
+            user_id=user.id,
+            next_due_at=tomorrow + timedelta(days=i),
+        )
+        for i in range(300)
+    )
+    db.commit()
+    _analyze(db, "chore")
+
+    statement = select(Chore.id).where(
+        Chore.user_id == user.id, Chore.next_due_at < tomorrow
+    )
+    conditions = _index_conditions(_explain(db, statement))
+    assert "user_id =" in conditions
+    assert "next_due_at <" in conditions
+
+
+def test_pending_chore_logs_use_partial_index(db: Session) -> None:
+    user = create_random_user(db)
+    chore = Chore(
+        name="Laundry",
+        frequency=ChoreFrequency.WEEKLY,
+        estimated_time_minutes=30,
+        user_id=user.id,
+    )
+    db.add(chore)
+    db.commit()
+
+    statement = select(ChoreLog.id).where(
+        ChoreLog.chore_id == chore.id,
+        ChoreLog.day == date.today(),
+        ChoreLog.actual_time_minutes == literal_column("0"),
+    )
+    assert "ix_chorelog_pending_chore_id_day" in _explain(db, statement)
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app import crud
+from app.models import Task, TaskStatus, UserDayStats
+from app.tests.utils.dailyos import (
+    build_task,
+    create_random_goal,
+    create_random_project,
+)
+from app.tests.utils.user import create_random_user
+
+
+def _user_rows(db: Session, user_id: object) -> list[tuple[object, ...]]:
+    rows = db.exec(
+        select(UserDayStats)
+        .where(UserDayStats.user_id == user_id)
+        .order_by(UserDayStats.day)
+    ).all()
+    return [
+        (
+            row.day,
+            row.tasks_total,
+            row.tasks_done,
+            row.task_minutes,
+            row.chore_count,
+            row.chore_minutes,
+        )
+        for row in rows
+    ]
+
+
+def test_update_user_day_stats_matches_rebuild(db: Session) -> None:
+    user = create_random_user(db)
+    goal = create_random_goal(db, create_random_project(db, user.id).id)
+    today = datetime.utcnow()
+    yesterday = today - timedelta(days=1)
+
+    tasks = [
+        build_task(goal, date=today, actual_time_minutes=30),
+        build_task(
+            goal, date=today, status=TaskStatus.DONE, actual_time_minutes=15
+        ),
+        build_task(goal, date=yesterday, actual_time_minutes=45),
+    ]
+    for task in tasks:
+        db.add(task)
+        crud.update_user_day_stats(
+            session=db, user_id=user.id, changes=[crud.task_day_stats(task)]
+        )
+    db.commit()
+
+    # Move a task to another day and mark it done
+    moved = tasks[0]
+    previous_stats = crud.task_day_stats(moved, sign=-1)
+    moved.date = yesterday
+    moved.status = TaskStatus.DONE
+    db.add(moved)
+    crud.update_user_day_stats(
+        session=db,
+        user_id=user.id,
+        changes=[previous_stats, crud.task_day_stats(moved)],
+    )
+    db.commit()
+
+    incremental = _user_rows(db, user.id)
+    assert incremental == [
+        (yesterday.date(), 2, 1, 75, 0, 0),
+        (today.date(), 1, 1, 15, 0, 0),
+    ]
+
+    crud.rebuild_user_day_stats(session=db, user_id=user.id)
+    db.commit()
+    db.expire_all()
+    assert _user_rows(db, user.id) == incremental
+
+
+def test_remove_user_day_stats_matches_rebuild(db: Session) -> None:
+    user = create_random_user(db)
+    project = create_random_project(db, user.id)
+    kept, deleted = (create_random_goal(db, project.id) for _ in range(2))
+    today = datetime.utcnow()
+    yesterday = today - timedelta(days=1)
+    db.add_all(
+        [
+            build_task(kept, date=today, actual_time_minutes=20),
+            build_task(deleted, date=today, actual_time_minutes=10),
+            build_task(
+                deleted, date=yesterday, status=TaskStatus.DONE, actual_time_minutes=5
+            ),
+        ]
+    )
+    db.commit()
+    crud.rebuild_user_day_stats(session=db, user_id=user.id)
+    db.commit()
+
+    crud.remove_user_day_stats(
+        session=db, user_id=user.id, task_filter=Task.goal_id == deleted.id
+    )
+    db.delete(deleted)
+    db.commit()
+    db.expire_all()
+    # Days left without activity keep an all-zero row
+    incremental = [row for row in _user_rows(db, user.id) if any(row[1:])]
+    assert incremental == [(today.date(), 1, 0, 20, 0, 0)]
+
+    crud.rebuild_user_day_stats(session=db, user_id=user.id)
+    db.commit()
+    db.expire_all()
+    assert _user_rows(db, user.id) == incremental
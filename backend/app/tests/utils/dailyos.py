@@ -0,0 +1,81 @@
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import Chore, ChoreFrequency, Goal, Project, Task, TaskStatus
+from app.tests.utils.utils import random_lower_string
+
+
+def create_random_project(db: Session, user_id: uuid.UUID) -> Project:
+    project = Project(
+        name=random_lower_string(),
+        daily_time_allocated_minutes=120,
+        weekly_time_allocated_minutes=600,
+        user_id=user_id,
+    )
+    db.add(project)
+    db.commit()
+    db.refresh(project)
+    return project
+
+
+def create_random_goal(db: Session, project_id: uuid.UUID) -> Goal:
+    project = db.get(Project, project_id)
+    assert project is not None
+    goal = Goal(
+        name=random_lower_string(),
+        daily_time_allocated_minutes=60,
+        weekly_time_allocated_minutes=300,
+        project_id=project_id,
+        user_id=project.user_id,
+    )
+    db.add(goal)
+    db.commit()
+    db.refresh(goal)
+    return goal
+
+
+def create_random_chore(
+    db: Session,
+    user_id: uuid.UUID,
+    frequency: ChoreFrequency = ChoreFrequency.DAILY,
+    *,
+    due_from: date | None = None,
+    **recurrence: Any,
+) -> Chore:
+    chore = Chore(
+        name=random_lower_string(),
+        frequency=frequency,
+        estimated_time_minutes=15,
+        user_id=user_id,
+        **recurrence,
+    )
+    db.add(chore)
+    crud.reschedule_chores(
+        session=db,
+        chore_ids=[chore.id],
+        from_date=due_from or datetime.utcnow().date(),
+    )
+    db.commit()
+    db.refresh(chore)
+    return chore
+
+
+def build_task(
+    goal: Goal,
+    *,
+    date: datetime | None = None,
+    status: TaskStatus = TaskStatus.PLANNED,
+    actual_time_minutes: int = 0,
+) -> Task:
+    return Task(
+        name=random_lower_string(),
+        status=status,
+        actual_time_minutes=actual_time_minutes,
+        date=date or datetime.utcnow(),
+        goal_id=goal.id,
+        user_id=goal.user_id,
+    )
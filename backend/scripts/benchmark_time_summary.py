@@ -0,0 +1,138 @@
+"""
+Compare the old per-project / per-goal weekly summary loop with the grouped
+period-summary query.
+
+Seeds a throwaway user with projects, goals and tasks, times both versions
+and counts the statements each one sends, then deletes the user again.
+
+    python scripts/benchmark_time_summary.py --projects 20 --goals 5
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app import crud
+from app.core.db import engine
+from app.models import Goal, Project, SummaryPeriod, Task, User
+
+
+def legacy_weekly_summary(
+    session: Session, user_id: uuid.UUID, week_start: date
+) -> list[dict[str, Any]]:
+    week_end = week_start + timedelta(days=6)
+    summary = []
+    projects = session.exec(select(Project).where(Project.user_id == user_id)).all()
+    for project in projects:
+        goals = session.exec(select(Goal).where(Goal.project_id == project.id)).all()
+        project_time_logged = 0
+        for goal in goals:
+            tasks = session.exec(
+                select(Task).where(
+                    Task.goal_id == goal.id,
+                    Task.day >= week_start,
+                    Task.day < week_end + timedelta(days=1),
+                )
+            ).all()
+            project_time_logged += sum(task.actual_time_minutes for task in tasks)
+        summary.append({"project_id": project.id, "time_logged": project_time_logged})
+    return summary
+
+
+def seed(session: Session, projects: int, goals: int, tasks: int) -> User:
+    user = User(
+        email=f"benchmark-{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password="!",
+    )
+    session.add(user)
+    today = datetime.utcnow()
+    for p in range(projects):
+        project = Project(
+            name=f"Project {p}",
+            daily_time_allocated_minutes=60,
+            weekly_time_allocated_minutes=300,
+            user_id=user.id,
+        )
+        session.add(project)
+        for g in range(goals):
+            goal = Goal(
+                name=f"Goal {g}",
+                daily_time_allocated_minutes=30,
+                weekly_time_allocated_minutes=150,
+                project_id=project.id,
+                user_id=user.id,
+            )
+            session.add(goal)
+            for _ in range(tasks):
+                session.add(
+                    Task(
+                        name="Task",
+                        goal_id=goal.id,
+                        user_id=user.id,
+                        date=today - timedelta(days=random.randrange(14)),
+                        actual_time_minutes=random.randrange(90),
+                    )
+                )
+    session.commit()
+    return user
+
+
+def measure(label: str, repeat: int, run: Any) -> None:
+    statements = 0
+
+    def count(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        elapsed = (time.perf_counter() - started) / repeat * 1000
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    print(f"{label:>8}: {elapsed:8.2f} ms/request, {statements // repeat} statements")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--goals", type=int, default=5)
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per goal")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        user = seed(session, args.projects, args.goals, args.tasks)
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        try:
+            measure(
+                "legacy",
+                args.repeat,
+                lambda: legacy_weekly_summary(session, user.id, week_start),
+            )
+            measure(
+                "grouped",
+                args.repeat,
+                lambda: crud.get_time_summary(
+                    session=session,
+                    user_id=user.id,
+                    start=week_start,
+                    end=week_start + timedelta(days=6),
+                    period=SummaryPeriod.WEEK,
+                ),
+            )
+        finally:
+            session.delete(user)
+            session.commit()
+
+
+if __name__ == "__main__":
+    main()